@@ -5,8 +5,14 @@ import time
 import random
 from typing import Optional, Dict, List
 
+# Keep-alive connections held open to dockerd. The default (10) is below the
+# number of request threads and background workers that call Docker at once,
+# so under load most calls would open and drop a fresh socket.
+DOCKER_MAX_POOL_SIZE = 32
+
 try:
-    client = docker.from_env()
+    # One client for the whole process — every helper here shares its pool
+    client = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
     _docker_available = True
 except Exception as e:
     # Keep API alive even if Docker socket is not reachable (e.g., sandbox/permission issues)
@@ -14,6 +20,12 @@ except Exception as e:
     _docker_available = False
     print(f"⚠️  Docker unavailable, running in stub mode: {e}")
 
+
+def docker_available() -> bool:
+    """True when a Docker daemon was reachable at import (False in stub mode)"""
+    return _docker_available
+
+
 # simple IP generator for stub mode
 _stub_ip_counter = 10
 def _stub_ip(base: str = "10.250.0.") -> str:
@@ -103,36 +115,58 @@ def create_default_network():
         )
 
 
-def ip_in_docker_network(network_name: str, ip_address: str) -> bool:
-    """Return True if the IPv4 address belongs to any IPAM pool of the Docker network."""
+# Docker network name → its IPAM subnets. A network's pools are fixed when
+# it's created, so each is inspected once; remove_docker_network forgets it
+# in case the name is reused with a different CIDR.
+_network_pools: Dict[str, List[ipaddress.IPv4Network]] = {}
+
+
+def remove_docker_network(network_name: str) -> None:
+    """Remove a Docker network if it exists (no-op without Docker)"""
+    _network_pools.pop(network_name, None)
     if not _docker_available:
-        return True
+        return
     try:
-        net = client.networks.get(network_name)
+        client.networks.get(network_name).remove()
     except Exception:
-        # If network can't be found, default network contains 10.128.0.0/20
-        try:
-            ip = ipaddress.ip_address(ip_address)
-            return ip in ipaddress.ip_network("10.128.0.0/20")
-        except Exception:
-            return False
+        pass
 
-    configs = net.attrs.get("IPAM", {}).get("Config", []) or []
+
+def _ipam_pools(network_name: str) -> Optional[List[ipaddress.IPv4Network]]:
+    """IPAM subnets of a Docker network, or None if it can't be found."""
+    pools = _network_pools.get(network_name)
+    if pools is not None:
+        return pools
     try:
-        ip = ipaddress.ip_address(ip_address)
+        net = client.networks.get(network_name)
     except Exception:
-        return False
-
-    for c in configs:
+        return None
+    pools = []
+    for c in net.attrs.get("IPAM", {}).get("Config", []) or []:
         sub = c.get("Subnet") or c.get("subnet")
         if not sub:
             continue
         try:
-            if ip in ipaddress.ip_network(sub):
-                return True
+            pools.append(ipaddress.ip_network(sub))
         except Exception:
             continue
-    return False
+    _network_pools[network_name] = pools
+    return pools
+
+
+def ip_in_docker_network(network_name: str, ip_address: str) -> bool:
+    """Return True if the IPv4 address belongs to any IPAM pool of the Docker network."""
+    if not _docker_available:
+        return True
+    try:
+        ip = ipaddress.ip_address(ip_address)
+    except Exception:
+        return False
+    pools = _ipam_pools(network_name)
+    if pools is None:
+        # If network can't be found, default network contains 10.128.0.0/20
+        return ip in ipaddress.ip_network("10.128.0.0/20")
+    return any(ip in pool for pool in pools)
 
 def create_container(name: str, network: str = "gcp-default", image: str = "ubuntu:22.04", ip_address: Optional[str] = None):
     """
@@ -226,8 +260,8 @@ def stop_container(container_id: str):
     if not _docker_available:
         return True
     try:
-        container = client.containers.get(container_id)
-        container.stop()
+        # Low-level calls skip the inspect that containers.get() makes first
+        client.api.stop(container_id)
         return True
     except Exception as e:
         print(f"Error stopping container: {e}")
@@ -238,20 +272,19 @@ def start_container(container_id: str):
     if not _docker_available:
         return True
     try:
-        container = client.containers.get(container_id)
-        container.start()
+        client.api.start(container_id)
         return True
     except Exception as e:
         print(f"Error starting container: {e}")
         return False
 
 def delete_container(container_id: str):
-    """Delete Docker container"""
+    """Delete Docker container (force-remove kills it first, so no separate stop)"""
     if not _docker_available:
         return True
     try:
-        container = client.containers.get(container_id)
-        container.remove(force=True)
+        # Low-level call: one API round-trip instead of an inspect + remove
+        client.api.remove_container(container_id, force=True)
         return True
     except Exception as e:
         print(f"Error deleting container: {e}")
@@ -262,12 +295,51 @@ def get_container_status(container_id: str) -> Optional[str]:
     if not _docker_available:
         return "running"
     try:
-        container = client.containers.get(container_id)
-        return container.status
+        return client.api.inspect_container(container_id)["State"]["Status"]
     except:
         return None
 
 
+def get_container_statuses(container_ids: List[str], name_prefix: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """
+    Status of several containers from a single list call — {id: status},
+    None for any container Docker no longer knows about.
+
+    With *name_prefix* the list is filtered by container name instead of by
+    id, so a sweep over every container of one kind doesn't put each id in
+    the request.
+    """
+    if not _docker_available:
+        return {cid: "running" for cid in container_ids}
+    statuses: Dict[str, Optional[str]] = dict.fromkeys(container_ids)
+    if not container_ids:
+        return statuses
+    try:
+        filters = {"name": name_prefix} if name_prefix else {"id": list(container_ids)}
+        listed = client.api.containers(all=True, filters=filters)
+    except Exception:
+        return statuses
+    by_id = {c["Id"]: c.get("State") for c in listed}
+    for cid in container_ids:
+        if cid in by_id:
+            statuses[cid] = by_id[cid]
+            continue
+        # Stored ids may be the short form; Docker reports the full one
+        for full_id, state in by_id.items():
+            if full_id.startswith(cid):
+                statuses[cid] = state
+                break
+    return statuses
+
+
+def container_events(actions: List[str]):
+    """
+    Blocking iterator over dockerd's container events whose action is one of
+    *actions*, decoded to dicts. The stream stays open until dockerd drops it.
+    """
+    return client.events(decode=True, filters={"type": "container", "event": list(actions)})
+
+
 # ─── GKE / k3s helpers ────────────────────────────────────────────────────────
 
 # Pinned k3s images per GKE-compatible Kubernetes version
@@ -397,9 +469,9 @@ def create_k3s_cluster(cluster_name: str, kubernetes_version: str = "1.28") -> d
     ctx = ssl.create_default_context()
     ctx.check_hostname = False
     ctx.verify_mode = ssl.CERT_NONE
-    deadline = time.time() + 60
+    deadline = time.monotonic() + 60
     ready = False
-    while time.time() < deadline:
+    while time.monotonic() < deadline:
         try:
             urllib.request.urlopen(
                 f"https://{endpoint_ip}:6443/readyz", context=ctx, timeout=3
@@ -452,8 +524,8 @@ def get_k3s_kubeconfig(container_id: str, endpoint_ip: str) -> str:
             "current-context: stub\nkind: Config\npreferences: {}\nusers:\n- name: stub\n  user:\n    token: stub-token\n"
         )
     container = client.containers.get(container_id)
-    deadline = time.time() + 30
-    while time.time() < deadline:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
         exit_code, output = container.exec_run(
             "cat /etc/rancher/k3s/k3s.yaml", demux=False
         )
@@ -539,9 +611,9 @@ def create_k3s_agents(
         return [f"stub-agent-{pool_name}-{i}" for i in range(node_count)]
     # Fetch the k3s server token from the control-plane container
     server_container = client.containers.get(server_container_id)
-    deadline = time.time() + 30
+    deadline = time.monotonic() + 30
     token = None
-    while time.time() < deadline:
+    while time.monotonic() < deadline:
         code, out = server_container.exec_run(
             "cat /var/lib/rancher/k3s/server/node-token", demux=False
         )
@@ -637,8 +709,8 @@ def resize_k3s_agents(
         image = K3S_VERSION_MAP.get(kubernetes_version, K3S_VERSION_MAP["1.28"])
         server_container = client.containers.get(server_container_id)
         token = None
-        deadline = time.time() + 20
-        while time.time() < deadline:
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline:
             code, out = server_container.exec_run(
                 "cat /var/lib/rancher/k3s/server/node-token", demux=False
             )
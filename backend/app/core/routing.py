@@ -0,0 +1,238 @@
+"""
+Precompiled route dispatch.
+
+Starlette's router tries every registered route's regex in order for every
+request — with 300+ routes that linear scan is most of the routing cost.
+IndexedAPIRouter builds lookup structures once, after all routers have been
+included, and only regex-matches the handful of routes that can possibly
+apply. Anything the index can't answer (404, slash redirects, websockets)
+falls through to the stock Starlette loop, so behaviour is unchanged.
+
+A single alternation regex over every route (one re.match, dispatch on
+lastindex) was considered and not used: Python's re tries alternatives left
+to right, so a miss still walks all 300+ branches inside the engine, and
+without branch-reset groups every route's params need unique group names.
+The trie prunes to a few candidates before any regex runs.
+
+Routes added through IndexedAPIRouter are also built as ORJSONRoute, so
+JSON request bodies are parsed with orjson instead of the stdlib decoder.
+"""
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.routing import APIRoute, APIRouter
+from starlette.routing import BaseRoute, Match
+
+
+# ────────────────────────────────────────────────────────
+# Route index
+# ────────────────────────────────────────────────────────
+
+RESOLVE_CACHE_SIZE = 4096
+
+class _Node:
+    """One path segment in the route trie."""
+
+    __slots__ = ("static", "dyn", "rest", "routes")
+
+    def __init__(self):
+        self.static: Dict[str, "_Node"] = {}   # literal segment → child
+        self.dyn: Optional["_Node"] = None      # any segment containing a {param}
+        self.rest: List[int] = []               # {param:path} — matches whatever follows
+        self.routes: List[int] = []             # routes whose path ends here
+
+
+class RouteIndex:
+    """
+    Two-level lookup over the app's routes:
+
+    * ``static`` — {path: {method: route}} for param-less paths. A route only
+      goes in for a method if no earlier route (parameterised or not) would
+      also accept that path + method — Starlette is first-match-wins, and the
+      table must give the same answer.
+    * a segment trie over every route path. Walking it yields the ids of the
+      only routes whose regex could match, in registration order; those few
+      are then matched exactly as Starlette would.
+    * ``resolve`` — a bounded LRU over (method, path) → winning route, so
+      repeat hits on the same parameterised URL (operation polls, gets of
+      one resource) skip the trie walk and candidate matching entirely.
+    """
+
+    def __init__(self, routes: List[BaseRoute]):
+        self.size = len(routes)
+        self.routes = routes
+        self.static: Dict[str, Dict[str, BaseRoute]] = {}
+        self.root = _Node()
+        self.always: List[int] = []   # routes the trie can't model (mounts etc.)
+
+        # Per-index, so a rebuild after new routes drops stale answers
+        self.resolve = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._resolve)
+
+        for i, route in enumerate(routes):
+            path = getattr(route, "path", None)
+            if not path or not path.startswith("/") or getattr(route, "path_regex", None) is None:
+                self.always.append(i)
+                continue
+            self._insert(path, i)
+
+            methods = getattr(route, "methods", None)
+            if not methods or "{" in path:
+                continue
+            earlier = routes[:i]
+            for method in methods:
+                if not any(_accepts(r, path, method) for r in earlier):
+                    self.static.setdefault(path, {}).setdefault(method, route)
+
+    def _insert(self, path: str, i: int) -> None:
+        node = self.root
+        for seg in path[1:].split("/"):
+            if ":path}" in seg:
+                node.rest.append(i)
+                return
+            if "{" in seg:
+                if node.dyn is None:
+                    node.dyn = _Node()
+                node = node.dyn
+            else:
+                node = node.static.setdefault(sys.intern(seg), _Node())
+        node.routes.append(i)
+
+    def lookup(self, method: str, path: str) -> Optional[BaseRoute]:
+        by_method = self.static.get(path)
+        return by_method.get(method) if by_method else None
+
+    def candidates(self, path: str) -> List[BaseRoute]:
+        """Routes that might match *path*, in registration order."""
+        segs = path[1:].split("/")
+        depth_max = len(segs)
+        found = list(self.always)
+        stack = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            found.extend(node.rest)
+            if depth == depth_max:
+                found.extend(node.routes)
+                continue
+            child = node.static.get(segs[depth])
+            if child is not None:
+                stack.append((child, depth + 1))
+            if node.dyn is not None:
+                stack.append((node.dyn, depth + 1))
+        routes = self.routes
+        return [routes[i] for i in sorted(found)]
+
+    def _resolve(self, method: str, path: str) -> Optional[BaseRoute]:
+        """
+        The route Starlette would dispatch *method* *path* to — first FULL
+        match, else first PARTIAL (405) — or None for a 404/redirect. Route
+        matching only reads type, path and method, so the answer is a pure
+        function of the key.
+        """
+        scope = {"type": "http", "method": method, "path": path}
+        candidates = self.candidates(path)
+        # A route can only FULL-match if it accepts the method, so skip the
+        # regex for the rest; they're only needed to tell 405 from 404
+        for route in candidates:
+            methods = getattr(route, "methods", None)
+            if methods and method not in methods:
+                continue
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route
+        for route in candidates:
+            match, _ = route.matches(scope)
+            if match == Match.PARTIAL:
+                return route
+        return None
+
+
+def _accepts(route: BaseRoute, path: str, method: str) -> bool:
+    """Would *route* FULL-match an http request for path + method?"""
+    regex = getattr(route, "path_regex", None)
+    if regex is None or not regex.match(path):
+        return False
+    methods = getattr(route, "methods", None)
+    return not methods or method in methods
+
+
+# ────────────────────────────────────────────────────────
+# Request bodies
+# ────────────────────────────────────────────────────────
+
+class ORJSONRequest(Request):
+    """Request whose json() decodes with orjson (errors still subclass json.JSONDecodeError)."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands its endpoint an ORJSONRequest."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+# ────────────────────────────────────────────────────────
+# Router
+# ────────────────────────────────────────────────────────
+
+class IndexedAPIRouter(APIRouter):
+    """APIRouter that consults a RouteIndex before the linear route scan."""
+
+    _route_index: Optional[RouteIndex] = None
+
+    def add_api_route(self, path: str, endpoint: Callable, **kwargs: Any) -> None:
+        # include_router passes each route's own class through; plain
+        # APIRoutes are upgraded so every JSON body goes through orjson
+        route_class = kwargs.get("route_class_override") or self.route_class
+        if route_class is APIRoute:
+            kwargs["route_class_override"] = ORJSONRoute
+        super().add_api_route(path, endpoint, **kwargs)
+
+    def _index(self) -> RouteIndex:
+        # Built lazily on the first request (all include_router calls are done
+        # by then) and rebuilt if routes were added afterwards.
+        index = self._route_index
+        if index is None or index.size != len(self.routes):
+            index = self._route_index = RouteIndex(self.routes)
+        return index
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await super().__call__(scope, receive, send)
+            return
+
+        if "router" not in scope:
+            scope["router"] = self
+        index = self._index()
+
+        method, path = scope["method"], scope["path"]
+        route = index.lookup(method, path) or index.resolve(method, path)
+        if route is not None:
+            _, child_scope = route.matches(scope)
+            scope.update(child_scope)
+            await route.handle(scope, receive, send)
+            return
+
+        # Nothing can match — let Starlette do slash redirects / 404
+        await super().__call__(scope, receive, send)
+
+
+def use_indexed_router(app: FastAPI) -> None:
+    """
+    Switch *app*'s router to IndexedAPIRouter in place. The router instance
+    (routes, startup hooks, dependency overrides) is kept — only dispatch
+    changes.
+    """
+    app.router.__class__ = IndexedAPIRouter
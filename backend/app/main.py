@@ -1,8 +1,11 @@
 """Main FastAPI application"""
 import asyncio
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.middleware.auth import AuthBypassMiddleware
+from app.core.routing import use_indexed_router
 from app.services.compute.router import router as compute_router
 from app.services.compute.instance_groups import router as instance_groups_router
 from app.services.vpc.router import router as vpc_router
@@ -26,9 +29,14 @@ import os
 app = FastAPI(
     title="GCP Stimulator",
     description="Minimal GCP API simulator with Docker integration",
-    version="1.0.0"
+    version="1.0.0",
+    # Serialize route return values with orjson rather than the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 
+# Dispatch through a precompiled route table instead of a linear regex scan
+use_indexed_router(app)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -44,9 +52,12 @@ app.add_middleware(AuthBypassMiddleware)
 def root():
     return {"message": "GCP Stimulator API", "version": "1.0.0"}
 
+# Static liveness payload — serialized once, polled constantly by orchestrators
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
 @app.get("/health")
-def health():
-    return {"status": "healthy"}
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/auth/info")
 def auth_info(request: Request):
@@ -58,43 +69,41 @@ def auth_info(request: Request):
         "message": "All requests are accepted. Identity is extracted for logging only.",
     }
 
-# Register routers with GCP API paths
-app.include_router(compute_router, prefix="/compute/v1", tags=["Compute Engine"])
-app.include_router(instance_groups_router, prefix="/compute/v1", tags=["Instance Groups"])
-app.include_router(vpc_router, prefix="/compute/v1", tags=["VPC Networks"])
-app.include_router(projects_router, prefix="/cloudresourcemanager/v1", tags=["Projects"])
-app.include_router(iam_router, prefix="/v1", tags=["IAM & Admin"])
-
-# Cloud Storage (in-memory implementation)
-app.include_router(storage.router, tags=["Cloud Storage"])
-
-# GKE — registered at both /container/v1 (internal UI) and /v1 (gcloud CLI compatibility)
-app.include_router(gke_router, prefix="/container/v1", tags=["GKE"])
-app.include_router(gke_router, prefix="/v1", tags=["GKE (gcloud CLI)"])
-
-# Cloud Run — gcloud compatibility (run.googleapis.com/v2)
-app.include_router(run_router, prefix="/v1", tags=["Cloud Run v1"])
-app.include_router(run_router, prefix="/v2", tags=["Cloud Run"])
-app.include_router(run_router, prefix="/run/v2", tags=["Cloud Run (alt)"])
-
-# Artifact Registry — artifactregistry.googleapis.com/v1
-app.include_router(artifacts_router, prefix="/v1", tags=["Artifact Registry"])
-
-# Cloud Monitoring — monitoring.googleapis.com/v3
-app.include_router(monitoring_router, prefix="/v3", tags=["Cloud Monitoring"])
-app.include_router(monitoring_router, prefix="/monitoring/v3", tags=["Cloud Monitoring (alt)"])
-
-# Cloud Pub/Sub — pubsub.googleapis.com/v1
-app.include_router(pubsub_router, prefix="/v1", tags=["Cloud Pub/Sub"])
-app.include_router(pubsub_router, prefix="/pubsub/v1", tags=["Cloud Pub/Sub (alt)"])
-
-# Compute Engine Auto-Scaling — autoscaling.googleapis.com/v1
-app.include_router(autoscaling_router, prefix="/compute/v1", tags=["Autoscaling"])
-
-# Secret Manager — secretmanager.googleapis.com/v1
-app.include_router(secretmanager_router, prefix="/v1", tags=["Secret Manager"])
-app.include_router(secretmanager_router, prefix="/secretmanager/v1", tags=["Secret Manager (alt)"])
+# Register routers with GCP API paths. Order matters: routes are matched in
+# registration order, so the table is walked top to bottom in a single pass.
+ROUTER_MOUNTS = (
+    # (router, prefix, tags)
+    (compute_router, "/compute/v1", ["Compute Engine"]),
+    (instance_groups_router, "/compute/v1", ["Instance Groups"]),
+    (vpc_router, "/compute/v1", ["VPC Networks"]),
+    (projects_router, "/cloudresourcemanager/v1", ["Projects"]),
+    (iam_router, "/v1", ["IAM & Admin"]),
+    # Cloud Storage (in-memory implementation)
+    (storage.router, "", ["Cloud Storage"]),
+    # GKE — registered at both /container/v1 (internal UI) and /v1 (gcloud CLI compatibility)
+    (gke_router, "/container/v1", ["GKE"]),
+    (gke_router, "/v1", ["GKE (gcloud CLI)"]),
+    # Cloud Run — gcloud compatibility (run.googleapis.com/v2)
+    (run_router, "/v1", ["Cloud Run v1"]),
+    (run_router, "/v2", ["Cloud Run"]),
+    (run_router, "/run/v2", ["Cloud Run (alt)"]),
+    # Artifact Registry — artifactregistry.googleapis.com/v1
+    (artifacts_router, "/v1", ["Artifact Registry"]),
+    # Cloud Monitoring — monitoring.googleapis.com/v3
+    (monitoring_router, "/v3", ["Cloud Monitoring"]),
+    (monitoring_router, "/monitoring/v3", ["Cloud Monitoring (alt)"]),
+    # Cloud Pub/Sub — pubsub.googleapis.com/v1
+    (pubsub_router, "/v1", ["Cloud Pub/Sub"]),
+    (pubsub_router, "/pubsub/v1", ["Cloud Pub/Sub (alt)"]),
+    # Compute Engine Auto-Scaling — autoscaling.googleapis.com/v1
+    (autoscaling_router, "/compute/v1", ["Autoscaling"]),
+    # Secret Manager — secretmanager.googleapis.com/v1
+    (secretmanager_router, "/v1", ["Secret Manager"]),
+    (secretmanager_router, "/secretmanager/v1", ["Secret Manager (alt)"]),
+)
 
+for _router, _prefix, _tags in ROUTER_MOUNTS:
+    app.include_router(_router, prefix=_prefix, tags=_tags)
 
 def init_zones_and_machine_types(db):
     """Initialize zones and machine types if they don't exist"""
@@ -165,9 +174,14 @@ def initialize_default_projects(db):
         }
     ]
     
+    # One IN query for every default instead of a SELECT per project
+    existing_ids = {
+        pid for (pid,) in db.query(Project.id).filter(
+            Project.id.in_([p["id"] for p in default_projects])
+        )
+    }
     for proj_data in default_projects:
-        existing = db.query(Project).filter(Project.id == proj_data["id"]).first()
-        if not existing:
+        if proj_data["id"] not in existing_ids:
             project = Project(
                 id=proj_data["id"],
                 name=proj_data["name"],
@@ -183,11 +197,31 @@ def initialize_default_projects(db):
     print(f"✅ Default projects initialized")
 
 
+def initialize_default_networks():
+    """
+    Create the default VPC for every project. Runs to completion before the
+    server accepts traffic: ensure_default_network is check-then-insert, so
+    a create_project or VPC call racing it could add a second default network.
+    """
+    from app.models.database import SessionLocal, Project
+    from app.services.vpc.router import ensure_default_network
+    
+    db = SessionLocal()
+    try:
+        projects = db.query(Project).all()
+        for project in projects:
+            ensure_default_network(db, project.id)
+        print(f"✅ Initialized default networks for {len(projects)} projects")
+    except Exception as e:
+        print(f"⚠️  Error initializing default networks: {e}")
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize database tables, default networks, and background tasks"""
-    from app.models.database import SessionLocal, Project, Base, engine
-    from app.services.vpc.router import ensure_default_network
+    from app.models.database import SessionLocal, Base, engine
     
     # Create all tables
     Base.metadata.create_all(bind=engine)
@@ -199,17 +233,13 @@ async def startup_event():
         
         # Initialize zones and machine types
         init_zones_and_machine_types(db)
-        
-        # Initialize default networks for projects
-        projects = db.query(Project).all()
-        for project in projects:
-            ensure_default_network(db, project.id)
-        print(f"✅ Initialized default networks for {len(projects)} projects")
     except Exception as e:
         print(f"⚠️  Error initializing: {e}")
     finally:
         db.close()
     
+    initialize_default_networks()
+    
     # Start Cloud Monitoring alert evaluator
     evaluator = AlertPolicyEvaluator(monitoring_storage)
     asyncio.create_task(evaluator.start())
@@ -29,13 +29,23 @@ from starlette.responses import Response
 logger = logging.getLogger("stimulator.auth")
 
 # Paths that skip auth processing entirely
-_BYPASS_PATHS = {
+_BYPASS_PATHS = frozenset((
     "/health",
     "/",
     "/docs",
     "/openapi.json",
     "/redoc",
-}
+))
+
+# The only request headers identity resolution looks at. ASGI servers deliver
+# header names lower-cased, so raw scope headers can be filtered in one pass
+# without building a starlette Headers object.
+_IDENTITY_HEADERS = frozenset((b"authorization", b"x-stimulator-identity"))
+
+# Pre-encoded response header pairs — appended straight onto raw_headers so
+# each request skips MutableHeaders' replace-scan and the str→latin-1 encode.
+_IDENTITY_HEADER = b"x-stimulator-auth-identity"
+_MODE_HEADER_PAIR = (b"x-stimulator-auth-mode", b"bypass")
 
 
 def _extract_email_from_bearer(token: str) -> str:
@@ -71,15 +81,21 @@ def _resolve_identity(request: Request) -> tuple[str, str]:
     Returns:
         (identity: str, auth_method: str)
     """
+    found = {
+        name: value.decode("latin-1")
+        for name, value in request.scope["headers"]
+        if name in _IDENTITY_HEADERS
+    }
+
     # Priority 1: Authorization: Bearer <token>
-    auth_header = request.headers.get("Authorization", "")
+    auth_header = found.get(b"authorization", "")
     if auth_header.startswith("Bearer "):
         token = auth_header.removeprefix("Bearer ").strip()
         identity = _extract_email_from_bearer(token)
         return identity, "bearer"
 
     # Priority 2: X-Stimulator-Identity: user:ansh@example.com
-    sim_identity = request.headers.get("X-Stimulator-Identity", "")
+    sim_identity = found.get(b"x-stimulator-identity", "")
     if sim_identity:
         # Strip the "user:" / "serviceAccount:" prefix if present
         identity = sim_identity.split(":", 1)[-1] if ":" in sim_identity else sim_identity
@@ -97,7 +113,7 @@ class AuthBypassMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next) -> Response:
         # Skip processing for health/docs paths
-        if request.url.path in _BYPASS_PATHS:
+        if request.scope["path"] in _BYPASS_PATHS:
             response = await call_next(request)
             return response
 
@@ -109,20 +125,23 @@ class AuthBypassMiddleware(BaseHTTPMiddleware):
         request.state.auth_method = auth_method
         request.state.auth_mode = "bypass"
 
-        # Log request with identity
-        logger.info(
-            "[AUTH] %s %s — identity=%s (%s)",
-            request.method,
-            request.url.path,
-            identity,
-            auth_method,
-        )
+        # Log request with identity — skipped entirely unless INFO is enabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[AUTH] %s %s — identity=%s (%s)",
+                request.method,
+                request.scope["path"],
+                identity,
+                auth_method,
+            )
 
         # Always call the next handler — NEVER block in bypass mode
         response = await call_next(request)
 
         # Add informational headers to every response
-        response.headers["X-Stimulator-Auth-Identity"] = identity
-        response.headers["X-Stimulator-Auth-Mode"] = "bypass"
+        response.raw_headers.extend((
+            (_IDENTITY_HEADER, identity.encode("latin-1", "replace")),
+            _MODE_HEADER_PAIR,
+        ))
 
         return response
@@ -1,23 +1,55 @@
 """Database models and connection"""
-from sqlalchemy import create_engine, Column, String, DateTime, JSON, Boolean, Integer, LargeBinary, text, UniqueConstraint
+from sqlalchemy import create_engine, Column, String, DateTime, JSON, Boolean, Integer, LargeBinary, text, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import os
 
+import orjson
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:////tmp/gcs_stimulator.db")
 
-# For SQLite, disable connection pooling and table naming constraints
+
+# JSON columns (tags, labels, metadata, policies, ...) are decoded for every
+# row loaded; orjson does that several times faster than the stdlib codec.
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_JSON_CODEC = {"json_serializer": _json_serializer, "json_deserializer": orjson.loads}
+
+# For SQLite, disable connection pooling and table naming constraints.
+# A local file connection can't go stale, so there's no pre-ping round-trip
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, pool_pre_ping=True)
+    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, **_JSON_CODEC)
 else:
-    engine = create_engine(DATABASE_URL)
+    # Sized past FastAPI's 40-thread sync-route pool plus the background
+    # writers so concurrent requests never queue on connection checkout;
+    # LIFO keeps the hot few connections in use and lets the rest idle out.
+    # Recycle before server-side idle timeouts drop connections.
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=25,
+        max_overflow=25,
+        pool_use_lifo=True,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        **_JSON_CODEC,
+    )
 SessionLocal = sessionmaker(bind=engine)
 Base = declarative_base()
 
 class Instance(Base):
     """VM Instance = Docker Container"""
     __tablename__ = "instances"
+    __table_args__ = (
+        Index("ix_instances_project_zone_name", "project_id", "zone", "name", unique=True),
+        # Ephemeral external IPs (TEST-NET-3) are allocated by concurrent
+        # bring-ups; the index turns a duplicate into an IntegrityError to retry
+        Index("ix_instances_ephemeral_ip", "external_ip", unique=True,
+              sqlite_where=text("external_ip LIKE '203.0.113.%'"),
+              postgresql_where=text("external_ip LIKE '203.0.113.%'")),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String, nullable=False)
@@ -180,6 +212,12 @@ class Bucket(Base):
 class Object(Base):
     """Cloud Storage Object"""
     __tablename__ = "objects"
+    __table_args__ = (
+        # Partial: every object read filters deleted == False, so soft-deleted
+        # rows are left out of the index entirely
+        Index("ix_objects_live", "bucket_id", "name", "is_latest",
+              sqlite_where=text("deleted = 0"), postgresql_where=text("NOT deleted")),
+    )
     
     id = Column(String, primary_key=True)
     bucket_id = Column(String, nullable=False)  # Match actual column
@@ -472,6 +510,9 @@ class VPCPeering(Base):
 class IAMPolicyBinding(Base):
     """IAM policy binding: principal → role on a project"""
     __tablename__ = "iam_policy_bindings"
+    __table_args__ = (
+        Index("ix_iam_bindings_project_principal_role", "project_id", "principal", "role"),
+    )
 
     id         = Column(Integer, primary_key=True, autoincrement=True)
     project_id = Column(String, nullable=False)
@@ -500,6 +541,9 @@ class CustomRole(Base):
 class ServiceAccountKey(Base):
     """Service account key (JSON key file payload)"""
     __tablename__ = "service_account_keys"
+    __table_args__ = (
+        Index("ix_sa_keys_service_account_email", "service_account_email"),
+    )
 
     id                  = Column(String, primary_key=True)   # key ID (random hex)
     service_account_email = Column(String, nullable=False)
@@ -517,7 +561,7 @@ Base.metadata.create_all(engine)
 
 
 def _run_migrations() -> None:
-    """Add columns to pre-existing tables.
+    """Add columns and indexes to pre-existing tables.
     Safe to run multiple times — silently skips columns that already exist.
     """
     new_instance_cols = [
@@ -560,25 +604,39 @@ def _run_migrations() -> None:
                 conn.execute(text(f"ALTER TABLE instances ADD COLUMN {col} {typ}"))
                 conn.commit()
             except Exception:
-                pass
+                # Already applied. Roll back so the failed statement doesn't
+                # leave the connection's transaction aborted (PostgreSQL)
+                # and take every later step down with it
+                conn.rollback()
         for col, typ in new_cluster_cols:
             try:
                 conn.execute(text(f"ALTER TABLE gke_clusters ADD COLUMN {col} {typ}"))
                 conn.commit()
             except Exception:
-                pass
+                conn.rollback()
         for col, typ in new_nodepool_cols:
             try:
                 conn.execute(text(f"ALTER TABLE gke_node_pools ADD COLUMN {col} {typ}"))
                 conn.commit()
             except Exception:
-                pass
+                conn.rollback()
         for col, typ in new_subnet_cols:
             try:
                 conn.execute(text(f"ALTER TABLE subnets ADD COLUMN {col} {typ}"))
                 conn.commit()
             except Exception:
-                pass
+                conn.rollback()
+        # create_all() skips tables that already exist, so indexes added
+        # later have to be created here for older databases. They're built
+        # from the model definitions, so partial-index predicates come out in
+        # the connection's dialect and can't drift from the models.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(conn, checkfirst=True)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
 
 
 _run_migrations()
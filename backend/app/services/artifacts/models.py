@@ -6,7 +6,8 @@ Represents Docker images, tags, and metadata for Artifact Registry repositories.
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Any
+from functools import lru_cache
+from typing import Callable, Optional, Dict, List, Any
 import hashlib
 
 # ============================================================================
@@ -28,6 +29,28 @@ class ImageState:
     FAILED = "FAILED"
 
 
+# ============================================================================
+# SERIALIZATION
+# ============================================================================
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=64)
+def _serializer_for(cls: type) -> Callable[[Any], Any]:
+    """cls.to_dict if the type has one, else identity — resolved once per type, not per item."""
+    fn = getattr(cls, 'to_dict', None)
+    return fn if callable(fn) else _identity
+
+
+def _serialize_items(items: List[Any]) -> List[Any]:
+    """to_dict() every item; model lists are homogeneous, so dispatch on the first item's type."""
+    if not items:
+        return []
+    return list(map(_serializer_for(type(items[0])), items))
+
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -66,7 +89,7 @@ class DockerImage:
         data['created_time'] = self.created_time.isoformat() + 'Z'
         data['uploaded_time'] = self.uploaded_time.isoformat() + 'Z'
         data['update_time'] = self.update_time.isoformat() + 'Z'
-        data['layers'] = [l.to_dict() if hasattr(l, 'to_dict') else l for l in self.layers]
+        data['layers'] = _serialize_items(self.layers)
         return data
 
 
@@ -1,6 +1,5 @@
 """Artifact Registry (simulated) API."""
 from typing import Any, Dict, Optional, List
-import random
 import threading
 import json
 import logging
@@ -11,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.models.database import ArtifactRepository, get_db
 from app.core.docker_manager import ensure_local_registry
+from app.utils.ids import next_operation_id
 from .storage import storage as image_storage
 from .models import compute_digest, generate_image_id
 
@@ -35,7 +35,7 @@ def _repo_to_dict(repo: ArtifactRepository, project: str, location: str) -> Dict
 
 
 def _operation(project: str, location: str, metadata: Dict[str, Any], response: Dict[str, Any]) -> Dict[str, Any]:
-    op_id = random.randint(1_000_000_000_000, 9_999_999_999_999)
+    op_id = next_operation_id()
     name = f"projects/{project}/locations/{location}/operations/{op_id}"
     op = {
         "name": name,
@@ -208,7 +208,7 @@ def push_image(
     except ValueError as e:
         raise HTTPException(400, str(e))
     except Exception as e:
-        logger.error(f"Error pushing image: {e}")
+        logger.error("Error pushing image: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -237,7 +237,7 @@ def list_images(
             "nextPageToken": None,
         }
     except Exception as e:
-        logger.error(f"Error listing images: {e}")
+        logger.error("Error listing images: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -273,7 +273,7 @@ def get_image(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting image: {e}")
+        logger.error("Error getting image: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -307,7 +307,7 @@ def delete_image(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting image: {e}")
+        logger.error("Error deleting image: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -351,7 +351,7 @@ def create_tag(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating tag: {e}")
+        logger.error("Error creating tag: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -380,7 +380,7 @@ def list_tags(
             "nextPageToken": None,
         }
     except Exception as e:
-        logger.error(f"Error listing tags: {e}")
+        logger.error("Error listing tags: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -414,7 +414,7 @@ def delete_tag(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting tag: {e}")
+        logger.error("Error deleting tag: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -455,7 +455,7 @@ def pull_image(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error pulling image: {e}")
+        logger.error("Error pulling image: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -493,5 +493,5 @@ def image_stats(
             "storageStats": image_storage.get_stats(),
         }
     except Exception as e:
-        logger.error(f"Error getting stats: {e}")
+        logger.error("Error getting stats: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
@@ -71,7 +71,7 @@ class ArtifactImageStorage:
         # Store image
         self.images[project_id][location][repository_id][image_digest] = image
         
-        logger.info(f"Created image {image_digest} in {project_id}/{location}/{repository_id}")
+        logger.info("Created image %s in %s/%s/%s", image_digest, project_id, location, repository_id)
         return image
 
     def get_image(
@@ -126,7 +126,7 @@ class ArtifactImageStorage:
         # Delete metadata
         self.metadata.pop(image_digest, None)
         
-        logger.info(f"Deleted image {image_digest}")
+        logger.info("Deleted image %s", image_digest)
         return True
 
     # ========================================================================
@@ -160,7 +160,7 @@ class ArtifactImageStorage:
         
         self.tags[project_id][location][repository_id][tag_name] = tag
         
-        logger.info(f"Created tag {tag_name} -> {image_digest}")
+        logger.info("Created tag %s -> %s", tag_name, image_digest)
         return tag
 
     def get_tag(
@@ -200,7 +200,7 @@ class ArtifactImageStorage:
             return False
         
         del self.tags[project_id][location][repository_id][tag_name]
-        logger.info(f"Deleted tag {tag_name}")
+        logger.info("Deleted tag %s", tag_name)
         return True
 
     # ========================================================================
@@ -259,7 +259,7 @@ class ArtifactImageStorage:
             )
             tag_bindings[tag_name] = image_digest
         
-        logger.info(f"Pushed image {image_digest} with tags {tags}")
+        logger.info("Pushed image %s with tags %s", image_digest, tags)
         
         return {
             'image': image.to_dict(),
@@ -287,7 +287,7 @@ class ArtifactImageStorage:
             image_reference
         )
         if image:
-            logger.info(f"Pulled image {image_reference} (digest)")
+            logger.info("Pulled image %s (digest)", image_reference)
             return image
         
         # Try as tag
@@ -298,7 +298,7 @@ class ArtifactImageStorage:
                 tag.image_digest
             )
             if image:
-                logger.info(f"Pulled image {image_reference} (tag)")
+                logger.info("Pulled image %s (tag)", image_reference)
                 return image
         
         return None
@@ -43,7 +43,7 @@ class AutoscalingEvaluator:
                 await self._evaluate_all_policies()
                 await asyncio.sleep(self.evaluation_interval)
         except Exception as e:
-            logger.error(f"[AutoscalingEvaluator] Error in evaluator loop: {e}")
+            logger.error("[AutoscalingEvaluator] Error in evaluator loop: %s", e)
 
     async def stop(self):
         """Stop the evaluator."""
@@ -62,7 +62,7 @@ class AutoscalingEvaluator:
                         await self._evaluate_policy(project, zone, policy_id, policy)
 
         except Exception as e:
-            logger.error(f"[AutoscalingEvaluator] Error evaluating policies: {e}")
+            logger.error("[AutoscalingEvaluator] Error evaluating policies: %s", e)
 
     async def _evaluate_policy(self, project: str, zone: str, policy_id: str, policy) -> None:
         """Evaluate a single policy and take scaling action if needed."""
@@ -73,7 +73,7 @@ class AutoscalingEvaluator:
             # Get current metric value
             metric_value = await self._get_metric_value(project, policy)
             if metric_value is None:
-                logger.debug(f"[AutoscalingEvaluator] No metric data for {policy_id}")
+                logger.debug("[AutoscalingEvaluator] No metric data for %s", policy_id)
                 # Use simulated metric if no real data
                 metric_value = 50 + random.random() * 40  # 50-90%
 
@@ -96,7 +96,7 @@ class AutoscalingEvaluator:
                 await self._perform_scaling(project, zone, policy_id, policy, desired_size, metric_value)
 
         except Exception as e:
-            logger.error(f"[AutoscalingEvaluator] Error evaluating policy {policy_id}: {e}")
+            logger.error("[AutoscalingEvaluator] Error evaluating policy %s: %s", policy_id, e)
 
     async def _get_metric_value(self, project: str, policy) -> Optional[float]:
         """Get the current metric value for a policy."""
@@ -151,7 +151,7 @@ class AutoscalingEvaluator:
             return None
 
         except Exception as e:
-            logger.debug(f"[AutoscalingEvaluator] Error getting metric: {e}")
+            logger.debug("[AutoscalingEvaluator] Error getting metric: %s", e)
             return None
 
     async def _get_desired_size(self, policy, metric_value: float) -> int:
@@ -217,9 +217,9 @@ class AutoscalingEvaluator:
             )
 
             logger.info(
-                f"[AutoscalingEvaluator] {action}: {policy_id} "
-                f"from {old_size} to {desired_size} instances"
+                "[AutoscalingEvaluator] %s: %s from %s to %s instances",
+                action, policy_id, old_size, desired_size,
             )
 
         except Exception as e:
-            logger.error(f"[AutoscalingEvaluator] Error performing scaling: {e}")
+            logger.error("[AutoscalingEvaluator] Error performing scaling: %s", e)
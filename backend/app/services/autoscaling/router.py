@@ -56,7 +56,7 @@ async def create_autoscaler(
             scaling_rules=scaling_rules,
         )
 
-        logger.info(f"[Autoscaling] Created policy {policy_id} in {zone}")
+        logger.info("[Autoscaling] Created policy %s in %s", policy_id, zone)
         return policy.to_dict()
 
     except Exception as e:
@@ -118,7 +118,7 @@ async def update_autoscaler(
             enabled=enabled,
         )
 
-        logger.info(f"[Autoscaling] Updated policy {autoscaler}")
+        logger.info("[Autoscaling] Updated policy %s", autoscaler)
         return policy.to_dict()
 
     except HTTPException:
@@ -135,7 +135,7 @@ async def delete_autoscaler(project: str, zone: str, autoscaler: str) -> Dict[st
             raise HTTPException(status_code=404, detail="Autoscaler not found")
 
         storage.delete_policy(project, zone, autoscaler)
-        logger.info(f"[Autoscaling] Deleted policy {autoscaler}")
+        logger.info("[Autoscaling] Deleted policy %s", autoscaler)
         return {}
 
     except HTTPException:
@@ -168,7 +168,7 @@ def delete_instance_group(
         raise HTTPException(status_code=404, detail="Instance group not found")
 
     # Remove all members
-    db.query(InstanceGroupMember).filter_by(instance_group_id=ig.id).delete()
+    db.query(InstanceGroupMember).filter_by(instance_group_id=ig.id).delete(synchronize_session=False)
     
     # Delete the group
     db.delete(ig)
@@ -205,41 +205,42 @@ def add_instances_to_group(
     instances = body.get("instances", [])
     added_count = 0
 
+    names = []
     for inst_ref in instances:
         # Parse instance reference: "projects/{p}/zones/{z}/instances/{name}"
         inst_path = inst_ref.get("instance", "")
         parts = inst_path.split("/")
         if len(parts) >= 2:
-            inst_name = parts[-1]
+            names.append(parts[-1])
         else:
-            inst_name = inst_ref.get("instance", "")
-
-        # Verify instance exists
-        instance = db.query(Instance).filter_by(
-            project_id=project, zone=zone, name=inst_name
-        ).first()
-        
-        if not instance:
+            names.append(inst_ref.get("instance", ""))
+
+    # Look every referenced instance and membership up once, rather than two
+    # queries per reference (and again for a name repeated in the request)
+    statuses = dict(db.query(Instance.name, Instance.status).filter(
+        Instance.project_id == project, Instance.zone == zone, Instance.name.in_(names),
+    ))
+    members = {n for (n,) in db.query(InstanceGroupMember.instance_name).filter(
+        InstanceGroupMember.instance_group_id == ig.id,
+        InstanceGroupMember.project_id == project,
+        InstanceGroupMember.zone == zone,
+        InstanceGroupMember.instance_name.in_(names),
+    )}
+
+    for inst_name in names:
+        # Skip unknown instances and existing members
+        if inst_name not in statuses or inst_name in members:
             continue
-
-        # Check if already a member
-        existing = db.query(InstanceGroupMember).filter_by(
+        member = InstanceGroupMember(
             instance_group_id=ig.id,
             instance_name=inst_name,
             project_id=project,
             zone=zone,
-        ).first()
-
-        if not existing:
-            member = InstanceGroupMember(
-                instance_group_id=ig.id,
-                instance_name=inst_name,
-                project_id=project,
-                zone=zone,
-                status=instance.status,
-            )
-            db.add(member)
-            added_count += 1
+            status=statuses[inst_name],
+        )
+        db.add(member)
+        members.add(inst_name)
+        added_count += 1
 
     db.commit()
 
@@ -282,7 +283,7 @@ def remove_instances_from_group(
             instance_name=inst_name,
             project_id=project,
             zone=zone,
-        ).delete()
+        ).delete(synchronize_session=False)
 
     db.commit()
 
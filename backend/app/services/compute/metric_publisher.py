@@ -34,7 +34,7 @@ class ComputeMetricPublisher:
                 await self._publish_metrics()
                 await asyncio.sleep(self.publish_interval)
         except Exception as e:
-            logger.error(f"[ComputeMetricPublisher] Error in publisher loop: {e}")
+            logger.error("[ComputeMetricPublisher] Error in publisher loop: %s", e)
 
     async def stop(self):
         """Stop the metric publisher."""
@@ -67,7 +67,7 @@ class ComputeMetricPublisher:
                     await self._publish_instance_metrics(inst_data)
 
         except Exception as e:
-            logger.error(f"[ComputeMetricPublisher] Error publishing metrics: {e}")
+            logger.error("[ComputeMetricPublisher] Error publishing metrics: %s", e)
 
     async def _publish_instance_metrics(self, inst_data: Dict[str, Any]):
         """Publish metrics for a single instance."""
@@ -198,10 +198,12 @@ class ComputeMetricPublisher:
                     )
                     self.monitoring_storage.put_metric_descriptor(project, descriptor)
 
-            logger.debug(f"[ComputeMetricPublisher] Published {len(time_series_list)} metrics for {instance_id}")
+            # Once per instance per publish tick
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[ComputeMetricPublisher] Published %s metrics for %s", len(time_series_list), instance_id)
 
         except Exception as e:
-            logger.error(f"[ComputeMetricPublisher] Error publishing instance metrics: {e}")
+            logger.error("[ComputeMetricPublisher] Error publishing instance metrics: %s", e)
 
     def get_instance_count(self) -> int:
         """Get total count of instances being monitored."""
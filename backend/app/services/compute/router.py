@@ -4,23 +4,30 @@ Includes all existing instance/zone/machine-type endpoints plus
 Sprint 1 additions: static addresses, persistent disks, instance tags,
 instance metadata, and serial port output.
 """
-import random
 import ipaddress
 import hashlib
-from datetime import datetime
-from typing import Any, Dict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
 from app.models.database import (
-    get_db, Instance, Zone, MachineType, Network, Subnet,
+    get_db, SessionLocal, Instance, Zone, MachineType, Network, Subnet,
     Address, Disk,
 )
 from app.core.docker_manager import (
     create_container, stop_container, start_container,
-    delete_container, get_container_status, ip_in_docker_network,
+    delete_container, get_container_statuses, ip_in_docker_network,
+    docker_available, container_events,
 )
+from app.services.vpc.router import invalidate_subnet_cache
+from app.utils.ids import next_operation_id
 from app.utils.ip_manager import get_ip_at_offset
 
 from .models import (
@@ -35,9 +42,28 @@ router = APIRouter()
 # Helpers
 # ────────────────────────────────────────────────────────
 
+_COMPUTE_API = "https://www.googleapis.com/compute/v1"
+
+
+# Self-links are rebuilt for every resource in every response; the project and
+# zone prefixes come from a small, fixed set, so build each one only once.
+@lru_cache(maxsize=1024)
+def _project_link(project: str) -> str:
+    return f"{_COMPUTE_API}/projects/{project}"
+
+
+@lru_cache(maxsize=1024)
+def _zone_link(project: str, zone: str) -> str:
+    return f"{_project_link(project)}/zones/{zone}"
+
+
+def _instance_link(project: str, zone: str, name: str) -> str:
+    return f"{_zone_link(project, zone)}/instances/{name}"
+
+
 def _op(project: str, zone: str, op_type: str, target: str, extra: dict = None) -> dict:
     """Build a DONE compute#operation response."""
-    oid = str(random.randint(10 ** 12, 10 ** 13 - 1))
+    oid = next_operation_id()
     # Extract resource name from target link for easier testing
     resource_name = target.split("/")[-1] if "/" in target else target
     base = {
@@ -45,16 +71,13 @@ def _op(project: str, zone: str, op_type: str, target: str, extra: dict = None)
         "id": oid,
         "name": resource_name,  # Use resource name instead of operation ID
         "operationId": oid,
-        "zone": f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}",
+        "zone": _zone_link(project, zone),
         "operationType": op_type,
         "targetLink": target,
         "status": "DONE",
         "user": "user@example.com",
         "progress": 100,
-        "selfLink": (
-            f"https://www.googleapis.com/compute/v1/projects/{project}"
-            f"/zones/{zone}/operations/{oid}"
-        ),
+        "selfLink": f"{_zone_link(project, zone)}/operations/{oid}",
     }
     if extra:
         base.update(extra)
@@ -63,12 +86,12 @@ def _op(project: str, zone: str, op_type: str, target: str, extra: dict = None)
 
 def _global_op(project: str, region: str, op_type: str, target: str) -> dict:
     """Build a DONE operation for regional/global resources."""
-    oid = str(random.randint(10 ** 12, 10 ** 13 - 1))
+    oid = next_operation_id()
     return {
         "kind": "compute#operation",
         "id": oid,
         "name": oid,
-        "region": f"https://www.googleapis.com/compute/v1/projects/{project}/regions/{region}",
+        "region": f"{_project_link(project)}/regions/{region}",
         "operationType": op_type,
         "targetLink": target,
         "status": "DONE",
@@ -77,10 +100,18 @@ def _global_op(project: str, region: str, op_type: str, target: str) -> dict:
     }
 
 
-def _ensure_default_network_and_subnet(db: Session, project: str, region: str) -> Subnet:
+def _ensure_default_network_and_subnet(db: Session, project: str, region: str) -> Tuple[Network, Subnet, bool]:
     """
     Ensure default VPC network and subnet exist for the project.
-    Auto-creates them if missing. Returns the default subnet for the region.
+    Auto-creates them if missing. Returns the default network, the default
+    subnet for the region (so callers needn't look them up again) and
+    whether the subnet was created.
+
+    Only flushes — the caller's commit persists these rows together with the
+    instance, so an insert costs one transaction instead of three. The caller
+    also invalidates the VPC subnet cache after that commit when a subnet
+    was created; doing it here would let a concurrent read re-cache the list
+    before the new row is visible.
     """
     # Ensure default network exists
     default_network = db.query(Network).filter_by(project_id=project, name="default").first()
@@ -93,8 +124,7 @@ def _ensure_default_network_and_subnet(db: Session, project: str, region: str) -
             docker_network_name=f"gcp-vpc-{project}-default",
         )
         db.add(default_network)
-        db.commit()
-        db.refresh(default_network)
+        db.flush()
     
     # Ensure default subnet exists for this region
     default_subnet = db.query(Subnet).filter_by(
@@ -103,7 +133,8 @@ def _ensure_default_network_and_subnet(db: Session, project: str, region: str) -
         region=region
     ).first()
     
-    if not default_subnet:
+    created = default_subnet is None
+    if created:
         # Calculate CIDR range based on region (each region gets a /20 from 10.128.0.0/16)
         # Map regions to their CIDR ranges
         region_cidrs = {
@@ -129,10 +160,265 @@ def _ensure_default_network_and_subnet(db: Session, project: str, region: str) -
             next_available_ip=2,  # Start at .2 (skip .0 and .1)
         )
         db.add(default_subnet)
-        db.commit()
-        db.refresh(default_subnet)
+        db.flush()
     
-    return default_subnet
+    return default_network, default_subnet, created
+
+
+# ────────────────────────────────────────────────────────
+# Container bring-up
+# ────────────────────────────────────────────────────────
+
+CONTAINER_WORKERS = 8
+
+# create_instance commits the instance as PROVISIONING and returns; the
+# container is created here and the row flipped to RUNNING (or TERMINATED if
+# Docker refused). Pending bring-ups are tracked by instance id so stop,
+# start and delete can wait for the container they're about to act on.
+_container_pool = ThreadPoolExecutor(max_workers=CONTAINER_WORKERS, thread_name_prefix="compute-docker")
+_bringups: Dict[int, Future] = {}
+
+
+# A bring-up lives only in the process that started it, so a row left
+# PROVISIONING by a crash or restart would never leave that state. Rows still
+# PROVISIONING after BRINGUP_TIMEOUT_SECONDS are marked TERMINATED by a sweep
+# in every worker. Age, not ownership, decides: a sibling worker's healthy
+# bring-up is never that old, and one that is has its container removed when
+# its conditional UPDATE finds the row already failed.
+BRINGUP_TIMEOUT_SECONDS = 600
+BRINGUP_SWEEP_INTERVAL_SECONDS = 60
+_bringup_sweep_stop = threading.Event()
+
+
+def _fail_stale_bringups() -> None:
+    cutoff = datetime.utcnow() - timedelta(seconds=BRINGUP_TIMEOUT_SECONDS)
+    db = SessionLocal()
+    try:
+        failed = (db.query(Instance)
+                  .filter(Instance.status == "PROVISIONING", Instance.created_at < cutoff)
+                  .update({"status": "TERMINATED"}, synchronize_session=False))
+        db.commit()
+        if failed:
+            print(f"⚠️  Marked {failed} stalled instance bring-up(s) TERMINATED")
+    except Exception as e:
+        # Also covers a fresh database whose tables the app's startup hasn't created yet
+        db.rollback()
+        print(f"⚠️  Could not check for stalled bring-ups: {e}")
+    finally:
+        db.close()
+
+
+def _sweep_stale_bringups() -> None:
+    while True:
+        _fail_stale_bringups()
+        if _bringup_sweep_stop.wait(BRINGUP_SWEEP_INTERVAL_SECONDS):
+            return
+
+
+@router.on_event("startup")
+def _start_bringup_sweep() -> None:
+    threading.Thread(target=_sweep_stale_bringups, name="compute-bringup-sweep", daemon=True).start()
+
+
+@router.on_event("shutdown")
+def _finish_bringups() -> None:
+    _bringup_sweep_stop.set()
+    _container_pool.shutdown(wait=True)
+
+
+# Ephemeral external IPs come from TEST-NET-3, apart from the 192.0.2.x range
+# reserved static addresses use
+EPHEMERAL_IP_PREFIX = "203.0.113."
+# Each failed attempt means another bring-up committed an address, so this
+# only runs out under far more contention than CONTAINER_WORKERS produces
+EPHEMERAL_IP_ATTEMPTS = 16
+
+
+def _ephemeral_external_ip(db: Session) -> Optional[str]:
+    """
+    The lowest TEST-NET-3 address no instance holds, or None if all 254 are
+    taken. Read from the database rather than a counter, so it survives
+    restarts, agrees across workers and reuses addresses of deleted instances.
+    """
+    used = {ip for (ip,) in db.query(Instance.external_ip)
+            .filter(Instance.external_ip.startswith(EPHEMERAL_IP_PREFIX))}
+    for host in range(1, 255):
+        ip = f"{EPHEMERAL_IP_PREFIX}{host}"
+        if ip not in used:
+            return ip
+    return None
+
+
+def _record_bringup(instance_id: int, name: str, updates: dict, allocate_ip: bool) -> int:
+    """
+    Write a bring-up's outcome, returning the number of rows claimed (0 or 1).
+
+    Only a row still PROVISIONING is ours to finish. If it was deleted, or
+    stopped/started by another worker (whose _bringups can't see this one) in
+    the meantime, nothing is written and the caller's container is an orphan.
+
+    An ephemeral external IP only matters once the instance is up, so it's
+    allocated here. Concurrent bring-ups (other threads, other workers) can
+    pick the same address; ix_instances_ephemeral_ip rejects the loser, which
+    re-reads the used set and tries again.
+    """
+    for _ in range(EPHEMERAL_IP_ATTEMPTS if allocate_ip else 1):
+        db = SessionLocal()
+        try:
+            if allocate_ip:
+                updates["external_ip"] = _ephemeral_external_ip(db)
+            claimed = db.query(Instance).filter(
+                Instance.id == instance_id, Instance.status == "PROVISIONING",
+            ).update(updates, synchronize_session=False)
+            db.commit()
+            return claimed
+        except IntegrityError:
+            db.rollback()
+        finally:
+            db.close()
+    print(f"⚠️  No ephemeral external IP could be claimed for instance {name}")
+    updates.pop("external_ip", None)
+    return _record_bringup(instance_id, name, updates, allocate_ip=False)
+
+
+def _bring_up_container(instance_id: int, name: str, network: str, ip_address: str,
+                        external: bool = False) -> None:
+    container = None
+    try:
+        container = create_container(name, network=network, ip_address=ip_address)
+        updates = {
+            "status": "RUNNING",
+            "container_id": container["container_id"],
+            "container_name": container["container_name"],
+        }
+    except Exception as e:
+        print(f"⚠️  Failed to create container for instance {name}: {e}")
+        updates = {"status": "TERMINATED"}
+    claimed = _record_bringup(instance_id, name, updates, allocate_ip=external and container is not None)
+    if not claimed and container is not None:
+        print(f"⚠️  Instance {name} changed during bring-up, removing its container")
+        delete_container(container["container_id"])
+
+
+def _start_bringup(instance_id: int, name: str, network: str, ip_address: str,
+                   external: bool = False) -> None:
+    future = _container_pool.submit(_bring_up_container, instance_id, name, network, ip_address, external)
+    _bringups[instance_id] = future
+    # Runs at once if the bring-up already finished
+    future.add_done_callback(lambda _: _bringups.pop(instance_id, None))
+
+
+def _await_bringup(db: Session, i: Instance) -> None:
+    """Block until *i*'s container bring-up (if any) is done, then reload the row."""
+    future = _bringups.get(i.id)
+    if future is not None:
+        future.result()
+        db.refresh(i)
+
+
+# What _instance_resource reads (plus project_id for filtering). Reads select
+# just these as plain column tuples, leaving the rest of the row unfetched.
+_INSTANCE_RESOURCE_FIELDS = (
+    Instance.id, Instance.name, Instance.project_id, Instance.zone, Instance.status,
+    Instance.machine_type, Instance.tags, Instance.metadata_items, Instance.labels,
+    Instance.network_url, Instance.internal_ip, Instance.external_ip,
+    Instance.container_id, Instance.container_name, Instance.created_at,
+)
+
+# stop/start/delete only need the key, the container they act on and (for
+# delete) the external IP to release; the JSON columns (tags, metadata,
+# labels) are never decoded on those paths
+_INSTANCE_LIFECYCLE_COLUMNS = load_only(Instance.id, Instance.container_id, Instance.external_ip)
+
+
+# Docker container state → instance status. States not listed (created,
+# restarting, paused, or the container being gone) leave the status as is.
+_CONTAINER_STATUS = {"running": "RUNNING", "exited": "TERMINATED"}
+
+
+def _sync_instance_states(db: Session, instances: List[Instance]) -> None:
+    """
+    Refresh each instance's status from its container. Docker is asked once
+    — one list of every VM container, matched to the rows in memory — and
+    only rows whose status moved are written.
+    """
+    with_container = [i for i in instances if i.container_id]
+    if not with_container:
+        return
+    statuses = get_container_statuses([i.container_id for i in with_container], name_prefix="gcp-vm-")
+    changed = False
+    for i in with_container:
+        status = _CONTAINER_STATUS.get(statuses.get(i.container_id), i.status)
+        if status != i.status:
+            i.status = status
+            changed = True
+    if changed:
+        db.commit()
+
+
+# ────────────────────────────────────────────────────────
+# Container state watcher
+# ────────────────────────────────────────────────────────
+
+RECONCILE_INTERVAL_SECONDS = 60
+
+# Instance status is kept in step with dockerd by its event stream: a start
+# or die on a VM container updates that one row as it happens, and reads
+# never have to ask Docker. A slow full sweep catches anything missed while
+# the stream was down. Without Docker neither runs — the status the
+# lifecycle endpoints write is the status.
+_EVENT_STATUS = {"start": "RUNNING", "die": "TERMINATED"}   # die covers stop, kill and crash
+_watcher_stop = threading.Event()
+
+
+def _apply_container_event(container_id: str, status: str) -> None:
+    db = SessionLocal()
+    try:
+        db.query(Instance).filter(
+            Instance.container_id == container_id, Instance.status != status,
+        ).update({"status": status}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _watch_container_events() -> None:
+    while not _watcher_stop.is_set():
+        try:
+            for event in container_events(list(_EVENT_STATUS)):
+                name = event.get("Actor", {}).get("Attributes", {}).get("name", "")
+                if name.startswith("gcp-vm-"):
+                    _apply_container_event(event["id"], _EVENT_STATUS[event["Action"]])
+        except Exception as e:
+            print(f"⚠️  Container event stream interrupted, reconnecting: {e}")
+        _watcher_stop.wait(5)
+
+
+def _reconcile_instance_states() -> None:
+    while not _watcher_stop.wait(RECONCILE_INTERVAL_SECONDS):
+        db = SessionLocal()
+        try:
+            instances = (db.query(Instance)
+                         .options(load_only(Instance.id, Instance.container_id, Instance.status))
+                         .filter(Instance.container_id.isnot(None)).all())
+            _sync_instance_states(db, instances)
+        except Exception as e:
+            print(f"⚠️  Instance state reconciliation failed: {e}")
+        finally:
+            db.close()
+
+
+@router.on_event("startup")
+def _start_state_watcher() -> None:
+    if not docker_available():
+        return
+    threading.Thread(target=_watch_container_events, name="compute-events", daemon=True).start()
+    threading.Thread(target=_reconcile_instance_states, name="compute-reconcile", daemon=True).start()
+
+
+@router.on_event("shutdown")
+def _stop_state_watcher() -> None:
+    _watcher_stop.set()
 
 
 def _instance_resource(i: Instance, project: str) -> dict:
@@ -147,7 +433,7 @@ def _instance_resource(i: Instance, project: str) -> dict:
         "metadata": {"items": i.metadata_items or [], "fingerprint": ""},
         "labels": i.labels or {},
         "networkInterfaces": [{
-            "network": f"https://www.googleapis.com/compute/v1/projects/{project}/{i.network_url}",
+            "network": f"{_project_link(project)}/{i.network_url}",
             "networkIP": i.internal_ip,
             "name": "nic0",
             "accessConfigs": [{"type": "ONE_TO_ONE_NAT", "natIP": i.external_ip or ""}],
@@ -159,10 +445,7 @@ def _instance_resource(i: Instance, project: str) -> dict:
         }],
         "dockerContainerId": i.container_id,
         "dockerContainerName": i.container_name,
-        "selfLink": (
-            f"https://www.googleapis.com/compute/v1/projects/{project}"
-            f"/zones/{i.zone}/instances/{i.name}"
-        ),
+        "selfLink": _instance_link(project, i.zone, i.name),
         "creationTimestamp": i.created_at.isoformat() + "Z",
     }
 
@@ -179,7 +462,7 @@ def list_internet_gateways(project: str):
             "kind": "compute#internetGateway",
             "id": "default-internet-gateway",
             "name": "default-internet-gateway",
-            "network": f"https://www.googleapis.com/compute/v1/projects/{project}/global/networks/default",
+            "network": f"{_project_link(project)}/global/networks/default",
             "status": "ACTIVE",
             "backing": "docker-bridge-nat",
         }],
@@ -225,26 +508,47 @@ def get_project(project: str):
         "kind": "compute#project",
         "id": numeric_id,
         "name": project,
-        "selfLink": f"https://www.googleapis.com/compute/v1/projects/{project}",
+        "selfLink": _project_link(project),
         "defaultServiceAccount": f"{project}@developer.gserviceaccount.com",
         "commonInstanceMetadata": {"kind": "compute#metadata", "fingerprint": ""},
     }
 
 
+# Zones are seeded once at startup and never change, and gcloud fetches one
+# to validate almost every command, so the catalog is read once —
+# name → (region, status, description), in table order.
+_zone_catalog: Dict[str, Tuple[str, str, str]] = {}
+
+
+def _zones(db: Session) -> Dict[str, Tuple[str, str, str]]:
+    if not _zone_catalog:
+        # Filled in one update so a concurrent reader never sees half of it;
+        # an empty table isn't cached — the catalog may not be seeded yet
+        _zone_catalog.update({
+            z.name: (z.region, z.status, z.description or "")
+            for z in db.query(Zone.name, Zone.region, Zone.status, Zone.description)
+        })
+    return _zone_catalog
+
+
+def _zone_resource(project: str, name: str, zone: Tuple[str, str, str]) -> dict:
+    region, status, description = zone
+    return {
+        "name": name,
+        "region": region,
+        "status": status,
+        "description": description,
+        "selfLink": _zone_link(project, name),
+    }
+
+
 @router.get("/projects/{project}/zones/{zone}")
 def get_zone(project: str, zone: str, db: Session = Depends(get_db)):
     """Return zone info - gcloud CLI uses this for validation."""
-    z = db.query(Zone).filter_by(name=zone).first()
-    if not z:
+    z = _zones(db).get(zone)
+    if z is None:
         raise HTTPException(status_code=404, detail=f"Zone {zone} not found")
-    return {
-        "kind": "compute#zone",
-        "name": z.name,
-        "region": z.region,
-        "status": z.status,
-        "description": z.description or "",
-        "selfLink": f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{z.name}",
-    }
+    return {"kind": "compute#zone", **_zone_resource(project, zone, z)}
 
 
 # ────────────────────────────────────────────────────────
@@ -253,31 +557,35 @@ def get_zone(project: str, zone: str, db: Session = Depends(get_db)):
 
 @router.get("/projects/{project}/zones")
 def list_zones(project: str, db: Session = Depends(get_db)):
-    zones = db.query(Zone).all()
     return {
         "kind": "compute#zoneList",
-        "items": [{
-            "name": z.name,
-            "region": z.region,
-            "status": z.status,
-            "description": z.description or "",
-            "selfLink": f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{z.name}",
-        } for z in zones],
+        "items": [_zone_resource(project, name, z) for name, z in _zones(db).items()],
     }
 
 
+# The machine-type catalog is seeded once at startup and never changes, so
+# each zone's list response is serialized once and served as raw bytes.
+_machine_type_list_cache: Dict[str, bytes] = {}
+
+
 @router.get("/projects/{project}/zones/{zone}/machineTypes")
 def list_machine_types(project: str, zone: str, db: Session = Depends(get_db)):
-    types = db.query(MachineType).filter_by(zone=zone).all()
-    return {
-        "kind": "compute#machineTypeList",
-        "items": [{
-            "name": t.name,
-            "guestCpus": t.guest_cpus,
-            "memoryMb": t.memory_mb,
-            "zone": t.zone,
-        } for t in types],
-    }
+    body = _machine_type_list_cache.get(zone)
+    if body is None:
+        types = db.query(MachineType).filter_by(zone=zone).all()
+        body = orjson.dumps({
+            "kind": "compute#machineTypeList",
+            "items": [{
+                "name": t.name,
+                "guestCpus": t.guest_cpus,
+                "memoryMb": t.memory_mb,
+                "zone": t.zone,
+            } for t in types],
+        })
+        # Unknown zones aren't cached — the catalog may not be seeded yet
+        if types:
+            _machine_type_list_cache[zone] = body
+    return Response(content=body, media_type="application/json")
 
 
 # ────────────────────────────────────────────────────────
@@ -285,23 +593,44 @@ def list_machine_types(project: str, zone: str, db: Session = Depends(get_db)):
 # ────────────────────────────────────────────────────────
 
 @router.get("/projects/{project}/zones/{zone}/instances")
-def list_instances(project: str, zone: str, db: Session = Depends(get_db)):
-    instances = db.query(Instance).filter_by(project_id=project, zone=zone).all()
-    for i in instances:
-        if i.container_id:
-            st = get_container_status(i.container_id)
-            i.status = "RUNNING" if st == "running" else "TERMINATED" if st == "exited" else i.status
-    db.commit()
-    return {
+def list_instances(
+    project: str,
+    zone: str,
+    maxResults: int = Query(500, ge=1, le=500),
+    pageToken: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """
+    List instances one page at a time. Pages are keyset-paginated on the
+    auto-increment id (pageToken = last id returned), so only the rows in the
+    requested page are loaded. Statuses are kept current by the container
+    state watcher, so listing doesn't call Docker.
+    """
+    query = db.query(*_INSTANCE_RESOURCE_FIELDS).filter_by(project_id=project, zone=zone)
+    if pageToken:
+        if not pageToken.isdigit():
+            raise HTTPException(400, "Invalid pageToken")
+        query = query.filter(Instance.id > int(pageToken))
+    # Fetch one extra row to learn whether another page exists
+    instances = query.order_by(Instance.id).limit(maxResults + 1).all()
+    has_more = len(instances) > maxResults
+    instances = instances[:maxResults]
+
+    result = {
         "kind": "compute#instanceList",
         "items": [_instance_resource(i, project) for i in instances],
     }
+    if has_more:
+        result["nextPageToken"] = str(instances[-1].id)
+    return result
 
 
 @router.get("/projects/{project}/aggregated/instances")
 def list_instances_aggregated(project: str, db: Session = Depends(get_db)):
     """Return all instances grouped by zone (aggregated list) — used by gcloud."""
-    instances = db.query(Instance).filter_by(project_id=project).all()
+    # Plain column tuples — no ORM entity construction, identity-map
+    # bookkeeping or instrumented attribute access per row
+    instances = db.query(*_INSTANCE_RESOURCE_FIELDS).filter_by(project_id=project).all()
     items: dict = {}
     for i in instances:
         key = f"zones/{i.zone}"
@@ -312,27 +641,25 @@ def list_instances_aggregated(project: str, db: Session = Depends(get_db)):
 
 @router.get("/projects/{project}/zones/{zone}/instances/{instance_name}")
 def get_instance(project: str, zone: str, instance_name: str, db: Session = Depends(get_db)):
-    i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
+    i = db.query(*_INSTANCE_RESOURCE_FIELDS).filter_by(project_id=project, zone=zone, name=instance_name).first()
     if not i:
         raise HTTPException(404, "Instance not found")
-    if i.container_id:
-        st = get_container_status(i.container_id)
-        i.status = "RUNNING" if st == "running" else "TERMINATED" if st == "exited" else i.status
-        db.commit()
     return _instance_resource(i, project)
 
 
 @router.post("/projects/{project}/zones/{zone}/instances")
-async def create_instance(project: str, zone: str, body: dict, db: Session = Depends(get_db)):
+def create_instance(project: str, zone: str, body: dict, db: Session = Depends(get_db)):
     name = body["name"]
     machine_type = body.get("machineType", "e2-medium").split("/")[-1]
 
-    existing = db.query(Instance).filter_by(project_id=project, zone=zone, name=name).first()
-    if existing:
+    # PK-only probe served by ix_instances_project_zone_name — no row hydration
+    existing = db.query(Instance.id).filter_by(project_id=project, zone=zone, name=name).first()
+    if existing is not None:
         raise HTTPException(409, f"Instance {name} already exists")
 
     # Resolve network/subnet from the first interface (same behavior as gcloud payloads)
     network_name, subnet_name = None, "default"
+    nat_ip, wants_external = None, False
     if body.get("networkInterfaces"):
         net = body["networkInterfaces"][0].get("network", "")
         if net:
@@ -340,16 +667,24 @@ async def create_instance(project: str, zone: str, body: dict, db: Session = Dep
         sub = body["networkInterfaces"][0].get("subnetwork", "")
         if sub:
             subnet_name = sub.split("/")[-1]
+        # An accessConfig asks for an external IP: a given natIP must be a
+        # reserved static address, otherwise an ephemeral one is assigned at
+        # bring-up
+        access_configs = body["networkInterfaces"][0].get("accessConfigs") or []
+        if access_configs:
+            nat_ip = access_configs[0].get("natIP")
+            wants_external = not nat_ip
 
     # Resolve subnet by name or default to the subnet in the zone's region
     region = zone.rsplit('-', 1)[0]
     
-    # Auto-ensure default network/subnet exist if using default
+    # Auto-ensure default network/subnet exist if using default — the rows it
+    # returns are the ones the lookups below would fetch
+    net_record, subnet_created = None, False
     if subnet_name == "default" and (network_name is None or network_name == "default"):
-        _ensure_default_network_and_subnet(db, project, region)
-    
-    if subnet_name == "default":
-        network_name = network_name or "default"
+        network_name = "default"
+        net_record, subnet_record, subnet_created = _ensure_default_network_and_subnet(db, project, region)
+    elif subnet_name == "default":
         subnet_record = db.query(Subnet).filter_by(
             project_id=project,
             network=network_name,
@@ -399,7 +734,8 @@ async def create_instance(project: str, zone: str, body: dict, db: Session = Dep
     if not allocated_ip:
         raise HTTPException(400, f"No IPs available in subnet {subnet_name}")
 
-    net_record = db.query(Network).filter_by(project_id=project, name=network_name).first()
+    if net_record is None:
+        net_record = db.query(Network).filter_by(project_id=project, name=network_name).first()
     if not net_record:
         raise HTTPException(404, f"Network '{network_name}' not found")
 
@@ -407,86 +743,129 @@ async def create_instance(project: str, zone: str, body: dict, db: Session = Dep
     if not ip_in_docker_network(net_record.docker_network_name, allocated_ip):
         raise HTTPException(400, f"Allocated IP {allocated_ip} is not contained in Docker network '{net_record.docker_network_name}' IPAM pools")
 
-    container = create_container(name, network=net_record.docker_network_name, ip_address=allocated_ip)
+    # A natIP claims its static address for this instance
+    # A natIP claims its static address for this instance. The claim is a
+    # conditional UPDATE, so two creates racing for one address can't both win
+    if nat_ip:
+        claimed = db.query(Address).filter_by(
+            project_id=project, region=region, address=nat_ip, status="RESERVED",
+        ).update({"status": "IN_USE", "users": [_instance_link(project, zone, name)]},
+                 synchronize_session=False)
+        if not claimed:
+            taken = db.query(Address.name).filter_by(project_id=project, region=region, address=nat_ip).first()
+            if taken is None:
+                raise HTTPException(400, f"natIP {nat_ip} is not a reserved address in region {region}")
+            raise HTTPException(400, f"Address {taken.name} ({nat_ip}) is already in use")
+
     subnet_record.next_available_ip += 1
 
     # Extract tags, metadata, labels from request body
     tags_body = body.get("tags", {})
     meta_body = body.get("metadata", {})
+    # Boot disk parameters, looked up once for both fields that read them
+    init_params = (body.get("disks") or [{}])[0].get("initializeParams", {})
 
     instance = Instance(
         name=name,
         project_id=project,
         zone=zone,
         machine_type=machine_type,
-        status="RUNNING",
+        status="PROVISIONING",
         internal_ip=allocated_ip,
-        container_id=container["container_id"],
-        container_name=container["container_name"],
+        external_ip=nat_ip,
         network_url=f"global/networks/{network_name}",
-        subnetwork_url=f"regions/{zone.rsplit('-', 1)[0]}/subnetworks/{subnet_name}",
+        subnetwork_url=f"regions/{region}/subnetworks/{subnet_name}",
         subnet=subnet_name,
         tags=tags_body.get("items", []),
         metadata_items=meta_body.get("items", []),
         labels=body.get("labels", {}),
         description=body.get("description"),
-        source_image=body.get("disks", [{}])[0].get("initializeParams", {}).get("sourceImage", "debian-11"),
-        disk_size_gb=int(body.get("disks", [{}])[0].get("initializeParams", {}).get("diskSizeGb", 10)),
+        source_image=init_params.get("sourceImage", "debian-11"),
+        disk_size_gb=int(init_params.get("diskSizeGb", 10)),
     )
     db.add(instance)
+    # The flush assigns the id and applies the created_at default; read both
+    # before the commit expires them so the response needs no refresh SELECT.
+    # A concurrent create of the same name that got past the probe above is
+    # caught here by ix_instances_project_zone_name
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(409, f"Instance {name} already exists")
+    instance_id, created = instance.id, instance.created_at.isoformat() + "Z"
     db.commit()
-    db.refresh(instance)
+    if subnet_created:
+        invalidate_subnet_cache(project)
+
+    # Creating the container can take seconds; answer now and let the
+    # instance move from PROVISIONING to RUNNING in the background
+    _start_bringup(instance_id, name, net_record.docker_network_name, allocated_ip, wants_external)
 
     return _op(project, zone, "insert",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{name}",
-               {"targetId": str(instance.id),
+               _instance_link(project, zone, name),
+               {"targetId": str(instance_id),
                 "targetName": name,
-                "insertTime": instance.created_at.isoformat() + "Z",
-                "startTime": instance.created_at.isoformat() + "Z",
-                "endTime": instance.created_at.isoformat() + "Z"})
+                "insertTime": created,
+                "startTime": created,
+                "endTime": created})
 
 
 @router.post("/projects/{project}/zones/{zone}/instances/{instance_name}/stop")
-async def stop_instance(project: str, zone: str, instance_name: str, db: Session = Depends(get_db)):
-    i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
+def stop_instance(project: str, zone: str, instance_name: str, db: Session = Depends(get_db)):
+    i = (db.query(Instance).options(_INSTANCE_LIFECYCLE_COLUMNS)
+         .filter_by(project_id=project, zone=zone, name=instance_name).first())
     if not i:
         raise HTTPException(404, "Instance not found")
+    _await_bringup(db, i)
     if i.container_id:
         stop_container(i.container_id)
     i.status = "TERMINATED"
     db.commit()
     return _op(project, zone, "stop",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}")
+               _instance_link(project, zone, instance_name))
 
 
 @router.post("/projects/{project}/zones/{zone}/instances/{instance_name}/start")
-async def start_instance(project: str, zone: str, instance_name: str, db: Session = Depends(get_db)):
-    i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
+def start_instance(project: str, zone: str, instance_name: str, db: Session = Depends(get_db)):
+    i = (db.query(Instance).options(_INSTANCE_LIFECYCLE_COLUMNS)
+         .filter_by(project_id=project, zone=zone, name=instance_name).first())
     if not i:
         raise HTTPException(404, "Instance not found")
+    _await_bringup(db, i)
     if i.container_id:
         start_container(i.container_id)
     i.status = "RUNNING"
     db.commit()
     return _op(project, zone, "start",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}")
+               _instance_link(project, zone, instance_name))
 
 
 @router.delete("/projects/{project}/zones/{zone}/instances/{instance_name}")
-async def delete_instance(project: str, zone: str, instance_name: str, db: Session = Depends(get_db)):
-    i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
+def delete_instance(project: str, zone: str, instance_name: str, db: Session = Depends(get_db)):
+    i = (db.query(Instance).options(_INSTANCE_LIFECYCLE_COLUMNS)
+         .filter_by(project_id=project, zone=zone, name=instance_name).first())
     if not i:
         raise HTTPException(404, "Instance not found")
-    if i.container_id:
-        delete_container(i.container_id)
+    _await_bringup(db, i)
+    # The container removal talks to dockerd and the cleanup below to the
+    # database, so let them overlap
+    removal = _container_pool.submit(delete_container, i.container_id) if i.container_id else None
     # Release disk users
     for d in db.query(Disk).filter_by(project_id=project, zone=zone).all():
         if d.users and instance_name in d.users:
             d.users = [u for u in d.users if u != instance_name]
+    # Release a static address used as its natIP
+    if i.external_ip:
+        db.query(Address).filter_by(
+            project_id=project, region=zone.rsplit('-', 1)[0], address=i.external_ip, status="IN_USE",
+        ).update({"status": "RESERVED", "users": []}, synchronize_session=False)
     db.delete(i)
     db.commit()
+    if removal is not None:
+        removal.result()
     return _op(project, zone, "delete",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}")
+               _instance_link(project, zone, instance_name))
 
 
 # ────────────────────────────────────────────────────────
@@ -494,27 +873,27 @@ async def delete_instance(project: str, zone: str, instance_name: str, db: Sessi
 # ────────────────────────────────────────────────────────
 
 @router.post("/projects/{project}/zones/{zone}/instances/{instance_name}/setTags")
-async def set_tags(project: str, zone: str, instance_name: str,
-                   body: SetTagsRequest, db: Session = Depends(get_db)):
+def set_tags(project: str, zone: str, instance_name: str,
+             body: SetTagsRequest, db: Session = Depends(get_db)):
     i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
     if not i:
         raise HTTPException(404, "Instance not found")
     i.tags = body.items
     db.commit()
     return _op(project, zone, "setTags",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}")
+               _instance_link(project, zone, instance_name))
 
 
 @router.post("/projects/{project}/zones/{zone}/instances/{instance_name}/setMetadata")
-async def set_metadata(project: str, zone: str, instance_name: str,
-                       body: SetMetadataRequest, db: Session = Depends(get_db)):
+def set_metadata(project: str, zone: str, instance_name: str,
+                 body: SetMetadataRequest, db: Session = Depends(get_db)):
     i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
     if not i:
         raise HTTPException(404, "Instance not found")
     i.metadata_items = body.items
     db.commit()
     return _op(project, zone, "setMetadata",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}")
+               _instance_link(project, zone, instance_name))
 
 
 # ────────────────────────────────────────────────────────
@@ -540,7 +919,7 @@ def get_serial_port(project: str, zone: str, instance_name: str,
     ]
     return {
         "kind": "compute#serialPortOutput",
-        "selfLink": f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}/serialPort",
+        "selfLink": f"{_instance_link(project, zone, instance_name)}/serialPort",
         "contents": "\n".join(lines),
         "next": 0,
     }
@@ -558,8 +937,8 @@ def _address_resource(a: Address, project: str) -> dict:
         "address": a.address or "",
         "addressType": a.address_type,
         "status": a.status,
-        "region": f"https://www.googleapis.com/compute/v1/projects/{project}/regions/{a.region}",
-        "selfLink": f"https://www.googleapis.com/compute/v1/projects/{project}/regions/{a.region}/addresses/{a.name}",
+        "region": f"{_project_link(project)}/regions/{a.region}",
+        "selfLink": f"{_project_link(project)}/regions/{a.region}/addresses/{a.name}",
         "description": a.description or "",
         "users": a.users or [],
         "creationTimestamp": a.created_at.isoformat() + "Z",
@@ -590,8 +969,8 @@ def get_address(project: str, region: str, address_name: str, db: Session = Depe
 
 
 @router.post("/projects/{project}/regions/{region}/addresses")
-async def create_address(project: str, region: str,
-                         body: CreateAddressRequest, db: Session = Depends(get_db)):
+def create_address(project: str, region: str,
+                   body: CreateAddressRequest, db: Session = Depends(get_db)):
     existing = db.query(Address).filter_by(project_id=project, region=region, name=body.name).first()
     if existing:
         raise HTTPException(409, f"Address {body.name} already exists")
@@ -610,11 +989,11 @@ async def create_address(project: str, region: str,
     db.add(addr)
     db.commit()
     return _global_op(project, region, "insert",
-                      f"https://www.googleapis.com/compute/v1/projects/{project}/regions/{region}/addresses/{body.name}")
+                      f"{_project_link(project)}/regions/{region}/addresses/{body.name}")
 
 
 @router.delete("/projects/{project}/regions/{region}/addresses/{address_name}")
-async def delete_address(project: str, region: str, address_name: str, db: Session = Depends(get_db)):
+def delete_address(project: str, region: str, address_name: str, db: Session = Depends(get_db)):
     a = db.query(Address).filter_by(project_id=project, region=region, name=address_name).first()
     if not a:
         raise HTTPException(404, "Address not found")
@@ -623,7 +1002,7 @@ async def delete_address(project: str, region: str, address_name: str, db: Sessi
     db.delete(a)
     db.commit()
     return _global_op(project, region, "delete",
-                      f"https://www.googleapis.com/compute/v1/projects/{project}/regions/{region}/addresses/{address_name}")
+                      f"{_project_link(project)}/regions/{region}/addresses/{address_name}")
 
 
 # ────────────────────────────────────────────────────────
@@ -635,15 +1014,15 @@ def _disk_resource(d: Disk, project: str) -> dict:
         "kind": "compute#disk",
         "id": str(d.id),
         "name": d.name,
-        "zone": f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{d.zone}",
+        "zone": f"{_project_link(project)}/zones/{d.zone}",
         "sizeGb": str(d.size_gb),
-        "type": f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{d.zone}/diskTypes/{d.type}",
+        "type": f"{_project_link(project)}/zones/{d.zone}/diskTypes/{d.type}",
         "status": d.status,
         "sourceImage": d.source_image or "",
         "description": d.description or "",
         "labels": d.labels or {},
         "users": d.users or [],
-        "selfLink": f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{d.zone}/disks/{d.name}",
+        "selfLink": f"{_project_link(project)}/zones/{d.zone}/disks/{d.name}",
         "creationTimestamp": d.created_at.isoformat() + "Z",
     }
 
@@ -676,12 +1055,12 @@ def list_images(project: str, db: Session = Depends(get_db)):
     return {
         "kind": "compute#imageList",
         "items": [],
-        "selfLink": f"https://www.googleapis.com/compute/v1/projects/{project}/global/images"
+        "selfLink": f"{_project_link(project)}/global/images"
     }
 
 @router.post("/projects/{project}/zones/{zone}/disks")
-async def create_disk(project: str, zone: str,
-                      body: CreateDiskRequest, db: Session = Depends(get_db)):
+def create_disk(project: str, zone: str,
+                body: CreateDiskRequest, db: Session = Depends(get_db)):
     existing = db.query(Disk).filter_by(project_id=project, zone=zone, name=body.name).first()
     if existing:
         raise HTTPException(409, f"Disk {body.name} already exists")
@@ -700,11 +1079,11 @@ async def create_disk(project: str, zone: str,
     db.add(d)
     db.commit()
     return _op(project, zone, "insert",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/disks/{body.name}")
+               f"{_project_link(project)}/zones/{zone}/disks/{body.name}")
 
 
 @router.delete("/projects/{project}/zones/{zone}/disks/{disk_name}")
-async def delete_disk(project: str, zone: str, disk_name: str, db: Session = Depends(get_db)):
+def delete_disk(project: str, zone: str, disk_name: str, db: Session = Depends(get_db)):
     d = db.query(Disk).filter_by(project_id=project, zone=zone, name=disk_name).first()
     if not d:
         raise HTTPException(404, "Disk not found")
@@ -713,12 +1092,12 @@ async def delete_disk(project: str, zone: str, disk_name: str, db: Session = Dep
     db.delete(d)
     db.commit()
     return _op(project, zone, "delete",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/disks/{disk_name}")
+               f"{_project_link(project)}/zones/{zone}/disks/{disk_name}")
 
 
 @router.post("/projects/{project}/zones/{zone}/instances/{instance_name}/attachDisk")
-async def attach_disk(project: str, zone: str, instance_name: str,
-                      body: AttachDiskRequest, db: Session = Depends(get_db)):
+def attach_disk(project: str, zone: str, instance_name: str,
+                body: AttachDiskRequest, db: Session = Depends(get_db)):
     i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
     if not i:
         raise HTTPException(404, "Instance not found")
@@ -732,12 +1111,12 @@ async def attach_disk(project: str, zone: str, instance_name: str,
         d.users = users
     db.commit()
     return _op(project, zone, "attachDisk",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}")
+               _instance_link(project, zone, instance_name))
 
 
 @router.post("/projects/{project}/zones/{zone}/instances/{instance_name}/detachDisk")
-async def detach_disk(project: str, zone: str, instance_name: str,
-                      deviceName: str, db: Session = Depends(get_db)):
+def detach_disk(project: str, zone: str, instance_name: str,
+                deviceName: str, db: Session = Depends(get_db)):
     i = db.query(Instance).filter_by(project_id=project, zone=zone, name=instance_name).first()
     if not i:
         raise HTTPException(404, "Instance not found")
@@ -746,4 +1125,4 @@ async def detach_disk(project: str, zone: str, instance_name: str,
         d.users = [u for u in d.users if u != instance_name]
     db.commit()
     return _op(project, zone, "detachDisk",
-               f"https://www.googleapis.com/compute/v1/projects/{project}/zones/{zone}/instances/{instance_name}")
+               _instance_link(project, zone, instance_name))
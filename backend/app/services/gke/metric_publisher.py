@@ -34,7 +34,7 @@ class GKEMetricPublisher:
                 await self._publish_metrics()
                 await asyncio.sleep(self.publish_interval)
         except Exception as e:
-            logger.error(f"[GKEMetricPublisher] Error in publisher loop: {e}")
+            logger.error("[GKEMetricPublisher] Error in publisher loop: %s", e)
 
     async def stop(self):
         """Stop the metric publisher."""
@@ -65,7 +65,7 @@ class GKEMetricPublisher:
                     await self._publish_cluster_metrics(cluster_data)
 
         except Exception as e:
-            logger.error(f"[GKEMetricPublisher] Error publishing metrics: {e}")
+            logger.error("[GKEMetricPublisher] Error publishing metrics: %s", e)
 
     async def _publish_cluster_metrics(self, cluster_data: Dict[str, Any]):
         """Publish metrics for a single cluster."""
@@ -248,10 +248,12 @@ class GKEMetricPublisher:
                     )
                     self.monitoring_storage.put_metric_descriptor(project, descriptor)
 
-            logger.debug(f"[GKEMetricPublisher] Published {len(time_series_list)} metrics for cluster {cluster_id}")
+            # Once per cluster per publish tick
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[GKEMetricPublisher] Published %s metrics for cluster %s", len(time_series_list), cluster_id)
 
         except Exception as e:
-            logger.error(f"[GKEMetricPublisher] Error publishing cluster metrics: {e}")
+            logger.error("[GKEMetricPublisher] Error publishing cluster metrics: %s", e)
 
     def get_cluster_count(self) -> int:
         """Get total count of clusters being monitored."""
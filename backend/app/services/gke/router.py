@@ -1,10 +1,12 @@
 """GKE (Google Kubernetes Engine) API — cluster, node pool, addon management"""
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.models.database import get_db, GKECluster, GKENodePool, GKEAddon, SessionLocal
+from app.utils.ids import next_operation_id
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
-import threading, random
+import threading
 from datetime import datetime
 
 router = APIRouter()
@@ -13,6 +15,8 @@ _SUPPORTED_VERSIONS = ["1.30", "1.29", "1.28", "1.27"]
 _DEFAULT_VERSION = "1.28"
 _ops_lock = threading.Lock()
 _operations: Dict[str, Dict[str, Any]] = {}
+# Serialized poll responses, dropped whenever the operation changes
+_operation_bodies: Dict[str, bytes] = {}
 
 
 # ─── Serialisers ──────────────────────────────────────────────────────────────
@@ -130,7 +134,7 @@ def _addon_to_dict(a: GKEAddon) -> dict:
 
 
 def _operation_response(name: str, project: str, location: str, op_type: str) -> dict:
-    op_id = f"operation-{random.randint(1_000_000_000_000, 9_999_999_999_999)}"
+    op_id = f"operation-{next_operation_id()}"
     op = {
         "name": op_id,
         "operationType": op_type,
@@ -153,6 +157,7 @@ def _operation_response(name: str, project: str, location: str, op_type: str) ->
             oldest = list(_operations.keys())[:100]
             for k in oldest:
                 _operations.pop(k, None)
+                _operation_bodies.pop(k, None)
     return op
 
 
@@ -165,6 +170,7 @@ def _op_update(op_id: Optional[str], **updates):
             return
         op.update(updates)
         _operations[op_id] = op
+        _operation_bodies.pop(op_id, None)
 
 
 # ─── Background workers ────────────────────────────────────────────────────────
@@ -176,7 +182,7 @@ def _provision_cluster(cluster_id: int, op_id: Optional[str] = None):
     db = SessionLocal()
     try:
         _op_update(op_id, progress=15, status="RUNNING")
-        cluster = db.query(GKECluster).filter_by(id=cluster_id).first()
+        cluster = db.get(GKECluster, cluster_id)
         if not cluster:
             return
 
@@ -207,7 +213,7 @@ def _provision_cluster(cluster_id: int, op_id: Optional[str] = None):
         _op_update(op_id, status="ERROR", progress=100, error=str(e), endTime=datetime.utcnow().isoformat() + "Z")
         db2 = SessionLocal()
         try:
-            c = db2.query(GKECluster).filter_by(id=cluster_id).first()
+            c = db2.get(GKECluster, cluster_id)
             if c:
                 c.status = "ERROR"; db2.commit()
         finally:
@@ -225,10 +231,10 @@ def _delete_cluster_bg(cluster_id: int, container_id: Optional[str], cluster_nam
 
     db = SessionLocal()
     try:
-        cluster = db.query(GKECluster).filter_by(id=cluster_id).first()
+        cluster = db.get(GKECluster, cluster_id)
         if cluster:
-            db.query(GKENodePool).filter_by(cluster_name=cluster.name, project_id=cluster.project_id).delete()
-            db.query(GKEAddon).filter_by(cluster_name=cluster.name, project_id=cluster.project_id).delete()
+            db.query(GKENodePool).filter_by(cluster_name=cluster.name, project_id=cluster.project_id).delete(synchronize_session=False)
+            db.query(GKEAddon).filter_by(cluster_name=cluster.name, project_id=cluster.project_id).delete(synchronize_session=False)
             db.delete(cluster); db.commit()
         _op_update(op_id, progress=100, status="DONE", endTime=datetime.utcnow().isoformat() + "Z")
     except Exception as e:
@@ -244,7 +250,7 @@ def _stop_cluster_bg(cluster_id: int, container_id: str, op_id: Optional[str] =
     stop_k3s_cluster(container_id)
     db = SessionLocal()
     try:
-        c = db.query(GKECluster).filter_by(id=cluster_id).first()
+        c = db.get(GKECluster, cluster_id)
         if c:
             c.status = "STOPPED"; db.commit()
         _op_update(op_id, progress=100, status="DONE", endTime=datetime.utcnow().isoformat() + "Z")
@@ -263,7 +269,7 @@ def _start_cluster_bg(cluster_id: int, container_id: str, op_id: Optional[str] =
     time.sleep(5)
     db = SessionLocal()
     try:
-        c = db.query(GKECluster).filter_by(id=cluster_id).first()
+        c = db.get(GKECluster, cluster_id)
         if c:
             c.status = "RUNNING"; db.commit()
         _op_update(op_id, progress=100, status="DONE", endTime=datetime.utcnow().isoformat() + "Z")
@@ -282,7 +288,7 @@ def _delete_nodepool_bg(nodepool_id: int, container_ids: list, op_id: Optional[s
 
     db = SessionLocal()
     try:
-        np = db.query(GKENodePool).filter_by(id=nodepool_id).first()
+        np = db.get(GKENodePool, nodepool_id)
         if np:
             db.delete(np); db.commit()
         _op_update(op_id, progress=100, status="DONE", endTime=datetime.utcnow().isoformat() + "Z")
@@ -300,8 +306,8 @@ def _provision_nodepool_bg(np_id: int, cluster_id: int, node_count: int, pool_na
     db = SessionLocal()
     try:
         _op_update(op_id, progress=20, status="RUNNING")
-        cluster = db.query(GKECluster).filter_by(id=cluster_id).first()
-        np = db.query(GKENodePool).filter_by(id=np_id).first()
+        cluster = db.get(GKECluster, cluster_id)
+        np = db.get(GKENodePool, np_id)
         if not cluster or not np:
             return
         if not cluster.container_id or not cluster.endpoint:
@@ -318,7 +324,9 @@ def _provision_nodepool_bg(np_id: int, cluster_id: int, node_count: int, pool_na
             pool_name=pool_name,
             kubernetes_version=k8s_ver,
         )
-        np = db.query(GKENodePool).filter_by(id=np_id).first()
+        # Re-read, not the identity map — the pool may have been deleted
+        # while the agents were starting
+        np = db.get(GKENodePool, np_id, populate_existing=True)
         if np:
             np.container_ids = container_ids
             np.status = "RUNNING"
@@ -329,7 +337,7 @@ def _provision_nodepool_bg(np_id: int, cluster_id: int, node_count: int, pool_na
         _op_update(op_id, status="ERROR", progress=100, error=str(e), endTime=datetime.utcnow().isoformat() + "Z")
         _db2 = SessionLocal()
         try:
-            _np = _db2.query(GKENodePool).filter_by(id=np_id).first()
+            _np = _db2.get(GKENodePool, np_id)
             if _np:
                 _np.status = "ERROR"; _db2.commit()
         finally:
@@ -345,8 +353,8 @@ def _resize_nodepool_bg(np_id: int, cluster_id: int, desired: int, op_id: Option
     db = SessionLocal()
     try:
         _op_update(op_id, progress=25, status="RUNNING")
-        cluster = db.query(GKECluster).filter_by(id=cluster_id).first()
-        np = db.query(GKENodePool).filter_by(id=np_id).first()
+        cluster = db.get(GKECluster, cluster_id)
+        np = db.get(GKENodePool, np_id)
         if not cluster or not np:
             return
         k8s_ver = (cluster.master_version or "1.28").rsplit(".", 1)[0]
@@ -359,7 +367,7 @@ def _resize_nodepool_bg(np_id: int, cluster_id: int, desired: int, op_id: Option
             desired_count=desired,
             kubernetes_version=k8s_ver,
         )
-        np2 = db.query(GKENodePool).filter_by(id=np_id).first()
+        np2 = db.get(GKENodePool, np_id, populate_existing=True)
         if np2:
             np2.container_ids = updated_ids
             np2.node_count = desired
@@ -541,7 +549,7 @@ def update_cluster(
         import time; time.sleep(5)
         _db = SessionLocal()
         try:
-            _c = _db.query(GKECluster).filter_by(id=cid).first()
+            _c = _db.get(GKECluster, cid)
             if _c and _c.status == "RECONCILING":
                 _c.status = "RUNNING"; _db.commit()
         finally:
@@ -935,10 +943,16 @@ def get_server_config(project: str, location: str):
 @router.get("/projects/{project}/locations/{location}/operations/{operation_id}")
 def get_operation(project: str, location: str, operation_id: str):
     """Return live operation status if available; otherwise fallback DONE."""
+    # gcloud polls the same operation until it is DONE — serve the encoded
+    # body until _op_update changes it
     with _ops_lock:
-        op = _operations.get(operation_id)
-    if op:
-        return op
+        body = _operation_bodies.get(operation_id)
+        if body is None:
+            op = _operations.get(operation_id)
+            if op:
+                body = _operation_bodies[operation_id] = orjson.dumps(op)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
     return {
         "name": operation_id,
         "status": "DONE",
@@ -1217,7 +1231,7 @@ def upgrade_cluster(project: str, location: str, cluster_name: str,
         raise HTTPException(400, f"Unsupported version {new_version}. Supported: {_SUPPORTED_VERSIONS}")
     cluster.master_version = new_version
     db.commit()
-    op_id = str(random.randint(10 ** 12, 10 ** 13 - 1))
+    op_id = next_operation_id()
     return {
         "name": op_id,
         "operationType": "UPGRADE_MASTER",
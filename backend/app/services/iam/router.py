@@ -10,7 +10,7 @@ import json
 import random
 import secrets
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
@@ -59,10 +59,16 @@ _PREDEFINED_ROLES = [
 # Helpers
 # ────────────────────────────────────────────────────────
 
-def _sa_resource(sa: ServiceAccount, project: str) -> dict:
+def _sa_name_prefix(project: str) -> str:
+    return f"projects/{project}/serviceAccounts/"
+
+
+def _sa_resource(sa: ServiceAccount, project: str, name_prefix: Optional[str] = None) -> dict:
+    # List endpoints pass the prefix in so it's built once per response, not per account
+    email = sa.id
     return {
-        "name": f"projects/{project}/serviceAccounts/{sa.id}",
-        "email": sa.id,
+        "name": (name_prefix or _sa_name_prefix(project)) + email,
+        "email": email,
         "displayName": sa.display_name or "",
         "uniqueId": sa.unique_id,
         "projectId": sa.project_id,
@@ -71,15 +77,62 @@ def _sa_resource(sa: ServiceAccount, project: str) -> dict:
     }
 
 
+# Exactly the columns _sa_resource reads. List endpoints select just these,
+# so rows come back as lightweight tuples (with attribute access) rather
+# than hydrated, identity-mapped ORM entities.
+_SA_RESOURCE_COLUMNS = (
+    ServiceAccount.id, ServiceAccount.display_name, ServiceAccount.unique_id,
+    ServiceAccount.project_id, ServiceAccount.disabled, ServiceAccount.description,
+)
+
+
+def _role_resource(r: CustomRole, project: str) -> dict:
+    return {
+        "name": f"projects/{project}/roles/{r.role_id}",
+        "title": r.title,
+        "description": r.description or "",
+        "includedPermissions": r.permissions or [],
+        "stage": r.stage,
+        "deleted": r.deleted,
+    }
+
+
+# Same idea for _role_resource
+_ROLE_RESOURCE_COLUMNS = (
+    CustomRole.role_id, CustomRole.title, CustomRole.description,
+    CustomRole.permissions, CustomRole.stage, CustomRole.deleted,
+)
+
+
 def _bindings_for_project(project_id: str, db: Session) -> List[dict]:
     """Return list of {role, members} aggregated from flat rows."""
-    rows = db.query(IAMPolicyBinding).filter_by(project_id=project_id).all()
+    # Plain (role, principal) tuples — grouping needs nothing else from the row
+    rows = db.query(IAMPolicyBinding.role, IAMPolicyBinding.principal).filter_by(
+        project_id=project_id
+    ).all()
+    return _group_bindings(rows)
+
+
+def _group_bindings(pairs) -> List[dict]:
+    """Fold (role, principal) pairs into [{role, members}], in first-seen role order."""
     grouped: Dict[str, List[str]] = {}
-    for r in rows:
-        grouped.setdefault(r.role, []).append(r.principal)
+    for role, principal in pairs:
+        grouped.setdefault(role, []).append(principal)
     return [{"role": role, "members": members} for role, members in grouped.items()]
 
 
+def _service_account_exists(db: Session, email: str) -> bool:
+    """Existence check that selects only the PK — no ORM row is hydrated."""
+    return db.query(ServiceAccount.id).filter_by(id=email).first() is not None
+
+
+def _custom_role_exists(db: Session, project: str, role_id: str) -> bool:
+    """Same lean check for live (non-deleted) custom roles."""
+    return db.query(CustomRole.id).filter_by(
+        project_id=project, role_id=role_id, deleted=False
+    ).first() is not None
+
+
 def _mock_key_data(project: str, sa_email: str, key_id: str) -> str:
     """Generate a base64-encoded mock JSON service account key."""
     payload = {
@@ -115,12 +168,14 @@ def _init_default_service_accounts(db: Session, project: str):
         },
     ]
     
-    for account_data in default_accounts:
-        email = f"{account_data['accountId']}@{project}.iam.gserviceaccount.com"
-        
+    emails = [f"{a['accountId']}@{project}.iam.gserviceaccount.com" for a in default_accounts]
+    # One query for all of them rather than an existence check per account
+    existing = {sa_id for (sa_id,) in db.query(ServiceAccount.id).filter(ServiceAccount.id.in_(emails))}
+    now = datetime.utcnow()
+    
+    for account_data, email in zip(default_accounts, emails):
         # Check if account already exists
-        existing = db.query(ServiceAccount).filter_by(id=email).first()
-        if not existing:
+        if email not in existing:
             sa = ServiceAccount(
                 id=email,
                 project_id=project,
@@ -129,8 +184,8 @@ def _init_default_service_accounts(db: Session, project: str):
                 description=account_data.get("description"),
                 unique_id=str(random.randint(10 ** 20, 10 ** 21 - 1)),
                 disabled=False,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
             )
             db.add(sa)
     
@@ -144,28 +199,32 @@ def _init_default_service_accounts(db: Session, project: str):
 
 @router.get("/projects/{project}/serviceAccounts")
 def list_service_accounts(project: str, db: Session = Depends(get_db)):
-    accounts = db.query(ServiceAccount).filter_by(project_id=project).all()
-    return {"accounts": [_sa_resource(a, project) for a in accounts]}
+    accounts = db.query(*_SA_RESOURCE_COLUMNS).filter_by(project_id=project).all()
+    name_prefix = _sa_name_prefix(project)
+    return {"accounts": [_sa_resource(a, project, name_prefix) for a in accounts]}
 
 
 @router.post("/projects/{project}/serviceAccounts")
 def create_service_account(project: str, payload: ServiceAccountRequest,
                             db: Session = Depends(get_db)):
     email = f"{payload.accountId}@{project}.iam.gserviceaccount.com"
-    if db.query(ServiceAccount).filter_by(id=email).first():
+    if _service_account_exists(db, email):
         raise HTTPException(409, "Service account already exists")
+    now = datetime.utcnow()
     sa = ServiceAccount(
         id=email, project_id=project, email=email,
         display_name=payload.serviceAccount.displayName if payload.serviceAccount else None,
         description=payload.serviceAccount.description if payload.serviceAccount else None,
         unique_id=str(random.randint(10 ** 20, 10 ** 21 - 1)),
         disabled=False,
-        created_at=datetime.utcnow(), updated_at=datetime.utcnow(),
+        created_at=now, updated_at=now,
     )
     db.add(sa)
+    # Serialize before commit: every column is set client-side, and commit
+    # expires the instance — reading it afterwards would re-SELECT the row.
+    resource = _sa_resource(sa, project)
     db.commit()
-    db.refresh(sa)
-    return _sa_resource(sa, project)
+    return resource
 
 
 @router.get("/projects/{project}/serviceAccounts/{email:path}")
@@ -182,11 +241,11 @@ def delete_service_account(project: str, email: str, db: Session = Depends(get_d
     if not sa:
         raise HTTPException(404, "Service account not found")
     # Cascade: delete keys and bindings
-    db.query(ServiceAccountKey).filter_by(service_account_email=email).delete()
+    db.query(ServiceAccountKey).filter_by(service_account_email=email).delete(synchronize_session=False)
     db.query(IAMPolicyBinding).filter(
         IAMPolicyBinding.project_id == project,
         IAMPolicyBinding.principal == f"serviceAccount:{email}"
-    ).delete()
+    ).delete(synchronize_session=False)
     db.delete(sa)
     db.commit()
     return {}
@@ -223,6 +282,7 @@ def create_sa_key(project: str, email: str, db: Session = Depends(get_db)):
 
     key_id = secrets.token_hex(20)
     key_data = _mock_key_data(project, email, key_id)
+    valid_after = datetime.utcnow()
 
     key = ServiceAccountKey(
         id=key_id,
@@ -230,7 +290,7 @@ def create_sa_key(project: str, email: str, db: Session = Depends(get_db)):
         project_id=project,
         key_type="USER_MANAGED",
         private_key_data=key_data,
-        valid_after_time=datetime.utcnow(),
+        valid_after_time=valid_after,
         disabled=False,
     )
     db.add(key)
@@ -241,7 +301,7 @@ def create_sa_key(project: str, email: str, db: Session = Depends(get_db)):
         "keyType": "USER_MANAGED",
         "keyAlgorithm": "KEY_ALG_RSA_2048",
         "privateKeyData": key_data,           # base64 — download this
-        "validAfterTime": key.valid_after_time.isoformat() + "Z",
+        "validAfterTime": valid_after.isoformat() + "Z",
     }
 
 
@@ -283,17 +343,21 @@ def get_iam_policy(project: str, db: Session = Depends(get_db)):
 @router.post("/projects/{project}:setIamPolicy")
 def set_iam_policy(project: str, body: SetIamPolicyRequest, db: Session = Depends(get_db)):
     """Replace all bindings for a project (full replace, not merge)."""
-    db.query(IAMPolicyBinding).filter_by(project_id=project).delete()
-    for binding in body.policy.get("bindings", []):
-        role = binding.get("role", "")
-        for member in binding.get("members", []):
-            row = IAMPolicyBinding(project_id=project, principal=member, role=role)
-            db.add(row)
+    db.query(IAMPolicyBinding).filter_by(project_id=project).delete(synchronize_session=False)
+    pairs = [
+        (binding.get("role", ""), member)
+        for binding in body.policy.get("bindings", [])
+        for member in binding.get("members", [])
+    ]
+    db.add_all([IAMPolicyBinding(project_id=project, principal=member, role=role)
+                for role, member in pairs])
     db.commit()
+    # The table now holds exactly these pairs, in this order — answer from
+    # them instead of reading every binding straight back
     return {
         "version": 1,
         "etag": "simulated",
-        "bindings": _bindings_for_project(project, db),
+        "bindings": _group_bindings(pairs),
     }
 
 
@@ -323,7 +387,7 @@ def remove_iam_binding(project: str, body: RemoveIamBindingRequest, db: Session
     """Remove a single principal → role binding."""
     db.query(IAMPolicyBinding).filter_by(
         project_id=project, principal=body.principal, role=body.role
-    ).delete()
+    ).delete(synchronize_session=False)
     db.commit()
     return {
         "version": 1,
@@ -360,22 +424,13 @@ def get_predefined_role(role_id: str):
 
 @router.get("/projects/{project}/roles")
 def list_custom_roles(project: str, db: Session = Depends(get_db)):
-    roles = db.query(CustomRole).filter_by(project_id=project, deleted=False).all()
-    return {
-        "roles": [{
-            "name": f"projects/{project}/roles/{r.role_id}",
-            "title": r.title,
-            "description": r.description or "",
-            "includedPermissions": r.permissions or [],
-            "stage": r.stage,
-            "deleted": r.deleted,
-        } for r in roles]
-    }
+    roles = db.query(*_ROLE_RESOURCE_COLUMNS).filter_by(project_id=project, deleted=False).all()
+    return {"roles": [_role_resource(r, project) for r in roles]}
 
 
 @router.post("/projects/{project}/roles")
 def create_custom_role(project: str, body: CreateRoleRequest, db: Session = Depends(get_db)):
-    if db.query(CustomRole).filter_by(project_id=project, role_id=body.roleId, deleted=False).first():
+    if _custom_role_exists(db, project, body.roleId):
         raise HTTPException(409, f"Role {body.roleId} already exists")
     role_data = body.role
     r = CustomRole(
@@ -387,14 +442,9 @@ def create_custom_role(project: str, body: CreateRoleRequest, db: Session = Depe
         deleted=False,
     )
     db.add(r)
+    resource = _role_resource(r, project)
     db.commit()
-    db.refresh(r)
-    return {
-        "name": f"projects/{project}/roles/{r.role_id}",
-        "title": r.title, "description": r.description or "",
-        "includedPermissions": r.permissions or [],
-        "stage": r.stage, "deleted": r.deleted,
-    }
+    return resource
 
 
 @router.patch("/projects/{project}/roles/{role_id}")
@@ -411,13 +461,9 @@ def patch_custom_role(project: str, role_id: str, body: PatchRoleRequest,
         r.permissions = body.permissions
     if body.stage is not None:
         r.stage = body.stage
+    resource = _role_resource(r, project)
     db.commit()
-    return {
-        "name": f"projects/{project}/roles/{r.role_id}",
-        "title": r.title, "description": r.description or "",
-        "includedPermissions": r.permissions or [],
-        "stage": r.stage, "deleted": r.deleted,
-    }
+    return resource
 
 
 @router.delete("/projects/{project}/roles/{role_id}")
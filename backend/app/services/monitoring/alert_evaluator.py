@@ -5,7 +5,7 @@ Background task that periodically evaluates alert policies and sends notificatio
 """
 
 import asyncio
-import uuid
+import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
@@ -95,8 +95,8 @@ class AlertPolicyEvaluator:
             duration_seconds = int(duration_str.rstrip("s"))
 
             # Get time series matching filter
-            start_time = datetime.now(timezone.utc) - timedelta(seconds=duration_seconds)
             end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(seconds=duration_seconds)
 
             time_series_list = self.storage.list_time_series(
                 project=project,
@@ -268,7 +268,7 @@ class AlertPolicyEvaluator:
                 message = f"Alert: {policy.display_name} is now {state}"
 
                 notification = NotificationHistory(
-                    id=uuid.uuid4().hex[:12],
+                    id=secrets.token_hex(6),
                     policy_name=policy.name,
                     channel_name=channel_name,
                     state=state,
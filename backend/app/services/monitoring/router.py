@@ -8,7 +8,8 @@ Implements GCP Cloud Monitoring REST API v3 endpoints for:
 - NotificationChannels (CRUD)
 """
 
-import uuid
+import logging
+import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List
 
@@ -35,6 +36,8 @@ from .storage import MonitoringStorage
 # Global storage instance (shared across all requests)
 storage = MonitoringStorage()
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -83,7 +86,7 @@ async def create_metric_descriptor(project: str, request: Dict[str, Any]) -> Dic
         # Store
         storage.put_metric_descriptor(project, descriptor)
 
-        print(f"[Monitoring] Created metric descriptor: {metric_type}")
+        logger.info("[Monitoring] Created metric descriptor: %s", metric_type)
         return descriptor.to_dict()
 
     except HTTPException:
@@ -185,7 +188,10 @@ async def write_time_series(project: str, request: Dict[str, Any]) -> Dict[str,
 
             storage.put_time_series(project, ts_dict)
 
-        print(f"[Monitoring] Wrote {len(time_series_list)} time series for project {project}")
+        # Hot path (metric publishers write constantly) — skipped entirely
+        # unless DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Monitoring] Wrote %s time series for project %s", len(time_series_list), project)
         return {}
 
     except Exception as e:
@@ -234,7 +240,7 @@ async def list_time_series(
 
         # TODO: Handle optional aggregation (cross-series reduction)
         if aggregate_by:
-            print(f"[Monitoring] Aggregation requested but not yet implemented: {aggregate_by}")
+            logger.info("[Monitoring] Aggregation requested but not yet implemented: %s", aggregate_by)
 
         return {
             "timeSeries": [ts for ts in time_series_list],
@@ -257,7 +263,7 @@ async def query_time_series_mql(project: str, request: Dict[str, Any]) -> Dict[s
     """
     try:
         mql_query = request.get("query", "")
-        print(f"[Monitoring] MQL query (not fully implemented): {mql_query}")
+        logger.info("[Monitoring] MQL query (not fully implemented): %s", mql_query)
 
         # TODO: Implement full MQL parsing and execution
         # For now, return empty results
@@ -323,7 +329,7 @@ async def create_alert_policy(project: str, request: Dict[str, Any]) -> Dict[str
 
         # Create policy
         policy = AlertPolicy(
-            name=f"projects/{project}/alertPolicies/{uuid.uuid4().hex[:12]}",
+            name=f"projects/{project}/alertPolicies/{secrets.token_hex(6)}",
             display_name=request.get("displayName", ""),
             conditions=conditions,
             notification_channels=request.get("notificationChannels", []),
@@ -334,7 +340,7 @@ async def create_alert_policy(project: str, request: Dict[str, Any]) -> Dict[str
         # Store
         storage.put_alert_policy(project, policy)
 
-        print(f"[Monitoring] Created alert policy: {policy.display_name}")
+        logger.info("[Monitoring] Created alert policy: %s", policy.display_name)
         return policy.to_dict()
 
     except (ValueError, KeyError) as e:
@@ -411,7 +417,7 @@ async def update_alert_policy(
         policy.updated_at = datetime.now(timezone.utc)
         storage.update_alert_policy(project, policy)
 
-        print(f"[Monitoring] Updated alert policy: {policy.display_name}")
+        logger.info("[Monitoring] Updated alert policy: %s", policy.display_name)
         return policy.to_dict()
 
     except HTTPException:
@@ -442,7 +448,7 @@ async def create_notification_channel(
     """Create a notification channel (email, webhook, slack, etc.)."""
     try:
         channel = NotificationChannel(
-            name=f"projects/{project}/notificationChannels/{uuid.uuid4().hex[:12]}",
+            name=f"projects/{project}/notificationChannels/{secrets.token_hex(6)}",
             display_name=request.get("displayName", ""),
             type=request.get("type", "email"),
             labels=request.get("labels", {}),
@@ -451,7 +457,7 @@ async def create_notification_channel(
 
         storage.put_notification_channel(project, channel)
 
-        print(f"[Monitoring] Created notification channel: {channel.type}")
+        logger.info("[Monitoring] Created notification channel: %s", channel.type)
         return channel.to_dict()
 
     except (ValueError, KeyError) as e:
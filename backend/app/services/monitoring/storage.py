@@ -4,9 +4,10 @@ Cloud Monitoring storage layer.
 Handles in-memory storage and retrieval of metrics, descriptors, alerts, and notifications.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 import re
+import time
 
 from .models import (
     MetricDescriptor,
@@ -17,6 +18,10 @@ from .models import (
     Point,
 )
 
+# health_check() walks every stored time-series point; probes that poll it
+# get the last result for this many seconds instead of a fresh walk.
+HEALTH_CACHE_TTL_SECONDS = 30.0
+
 
 class MonitoringStorage:
     """In-memory storage for monitoring data."""
@@ -38,6 +43,9 @@ class MonitoringStorage:
         # Structure: [NotificationHistory] - all notifications sent
         self.notifications_sent: List[NotificationHistory] = []
 
+        # Single-slot health_check() cache: (monotonic timestamp, stats)
+        self._last_health: Optional[Tuple[float, Dict[str, int]]] = None
+
     # ========== METRIC DESCRIPTORS ==========
 
     def put_metric_descriptor(self, project: str, descriptor: MetricDescriptor) -> None:
@@ -182,6 +190,7 @@ class MonitoringStorage:
 
     def list_alert_policies(self, project: str) -> List[AlertPolicy]:
         """List all alert policies for a project."""
+        # A copy, not a view: the alert evaluator awaits between policies
         return list(self.alert_policies.get(project, {}).values())
 
     def update_alert_policy(self, project: str, policy: AlertPolicy) -> None:
@@ -212,9 +221,9 @@ class MonitoringStorage:
         """Retrieve a notification channel."""
         return self.notification_channels.get(project, {}).get(channel_id)
 
-    def list_notification_channels(self, project: str) -> List[NotificationChannel]:
-        """List all notification channels for a project."""
-        return list(self.notification_channels.get(project, {}).values())
+    def list_notification_channels(self, project: str) -> Iterable[NotificationChannel]:
+        """List all notification channels for a project (a live view)."""
+        return self.notification_channels.get(project, {}).values()
 
     def delete_notification_channel(self, project: str, channel_id: str) -> None:
         """Delete a notification channel."""
@@ -273,7 +282,11 @@ class MonitoringStorage:
         return False
 
     def health_check(self) -> Dict[str, int]:
-        """Return storage statistics for health checking."""
+        """Return storage statistics for health checking (cached for HEALTH_CACHE_TTL_SECONDS)."""
+        now = time.monotonic()
+        if self._last_health and now - self._last_health[0] < HEALTH_CACHE_TTL_SECONDS:
+            return self._last_health[1]
+
         total_descriptors = sum(len(d) for d in self.metric_descriptors.values())
         total_ts = sum(len(ts) for ts in self.time_series.values())
         total_policies = sum(len(p) for p in self.alert_policies.values())
@@ -284,7 +297,7 @@ class MonitoringStorage:
             for ts in ts_list
         )
 
-        return {
+        stats = {
             "metric_descriptors": total_descriptors,
             "time_series": total_ts,
             "time_series_points": total_points,
@@ -292,3 +305,5 @@ class MonitoringStorage:
             "notification_channels": total_channels,
             "notifications_sent": len(self.notifications_sent),
         }
+        self._last_health = (now, stats)
+        return stats
@@ -1,9 +1,12 @@
 """Project Management API"""
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import datetime
-from app.models.database import get_db, Project
+from app.models.database import get_db, Project, Network, Instance, Firewall, Route
+from app.services.vpc.router import ensure_default_network
+from app.services.iam.router import _init_default_service_accounts
 import random
 
 router = APIRouter()
@@ -28,7 +31,7 @@ def list_projects(db: Session = Depends(get_db)):
 @router.get("/projects/{project_id}")
 def get_project(project_id: str, db: Session = Depends(get_db)):
     """Get a specific project"""
-    project = db.query(Project).filter_by(id=project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
     
@@ -43,34 +46,33 @@ def get_project(project_id: str, db: Session = Depends(get_db)):
 @router.post("/projects")
 def create_project(project_data: ProjectCreate, db: Session = Depends(get_db)):
     """Create a new project"""
-    # Check if project already exists
-    existing = db.query(Project).filter_by(id=project_data.projectId).first()
-    if existing:
-        raise HTTPException(status_code=409, detail=f"Project {project_data.projectId} already exists")
-    
-    # Create new project
+    now = datetime.utcnow()
     project = Project(
         id=project_data.projectId,
         name=project_data.name or project_data.projectId,
         project_number=random.randint(100000, 999999),
         location="us-central1",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
         compute_api_enabled=True
     )
-    db.add(project)
-    db.commit()
+    # No existence SELECT first — the primary key refuses a duplicate, which
+    # saves a round-trip on every successful create
+    try:
+        db.add(project)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=f"Project {project_data.projectId} already exists")
     db.refresh(project)
     
     # Create default network for the project
-    from app.services.vpc.router import ensure_default_network
     try:
         ensure_default_network(db, project.id)
     except Exception as e:
         print(f"⚠️  Failed to create default network for {project.id}: {e}")
     
     # Phase 1: Initialize default service accounts
-    from app.services.iam.router import _init_default_service_accounts
     try:
         _init_default_service_accounts(db, project.id)
     except Exception as e:
@@ -86,32 +88,15 @@ def create_project(project_data: ProjectCreate, db: Session = Depends(get_db)):
 @router.delete("/projects/{project_id}")
 def delete_project(project_id: str, db: Session = Depends(get_db)):
     """Delete a project and all its resources"""
-    from app.models.database import Network, Instance, Firewall, Route
-    
     # Find project
-    project = db.query(Project).filter_by(id=project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
     
-    # Delete all instances
-    instances = db.query(Instance).filter_by(project_id=project_id).all()
-    for instance in instances:
-        db.delete(instance)
-    
-    # Delete all networks
-    networks = db.query(Network).filter_by(project_id=project_id).all()
-    for network in networks:
-        db.delete(network)
-    
-    # Delete all firewalls
-    firewalls = db.query(Firewall).filter_by(project_id=project_id).all()
-    for firewall in firewalls:
-        db.delete(firewall)
-    
-    # Delete all routes
-    routes = db.query(Route).filter_by(project_id=project_id).all()
-    for route in routes:
-        db.delete(route)
+    # Bulk-delete instances, networks, firewalls and routes — one DELETE per
+    # table instead of loading every row just to delete it
+    for model in (Instance, Network, Firewall, Route):
+        db.query(model).filter_by(project_id=project_id).delete(synchronize_session=False)
     
     # Delete project
     db.delete(project)
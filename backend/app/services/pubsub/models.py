@@ -50,7 +50,7 @@ class PubsubMessage:
     """A Pub/Sub message."""
     data: str                           # Base64-encoded message data
     attributes: Dict[str, str] = field(default_factory=dict)
-    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    message_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     publish_time: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
     def to_dict(self) -> Dict[str, Any]:
@@ -210,7 +210,9 @@ async def publish(
             msg_id = storage.publish_message(project, topic, data, attributes)
             message_ids.append(msg_id)
 
-        logger.info(f"[PubSub] Published {len(message_ids)} messages to {topic}")
+        # Per-publish log — skipped entirely unless INFO is enabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[PubSub] Published %s messages to %s", len(message_ids), topic)
         return {"messageIds": message_ids}
 
     except HTTPException:
@@ -263,7 +265,8 @@ async def acknowledge(
         ack_ids = request.get("ackIds", [])
         storage.acknowledge_messages(project, subscription, ack_ids)
 
-        logger.debug(f"[PubSub] Acknowledged {len(ack_ids)} messages in {subscription}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[PubSub] Acknowledged %s messages in %s", len(ack_ids), subscription)
         return {}
 
     except HTTPException:
@@ -286,7 +289,8 @@ async def nack(
         ack_ids = request.get("ackIds", [])
         storage.nack_messages(project, subscription, ack_ids)
 
-        logger.debug(f"[PubSub] Nacked {len(ack_ids)} messages in {subscription}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[PubSub] Nacked %s messages in %s", len(ack_ids), subscription)
         return {}
 
     except HTTPException:
@@ -4,7 +4,7 @@ Cloud Pub/Sub storage layer.
 Handles in-memory storage and retrieval of topics, subscriptions, and messages.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 import uuid
 import base64
@@ -55,9 +55,9 @@ class PubSubStorage:
         """Retrieve a topic."""
         return self.topics.get(project, {}).get(topic_id)
 
-    def list_topics(self, project: str) -> List[Topic]:
-        """List all topics in a project."""
-        return list(self.topics.get(project, {}).values())
+    def list_topics(self, project: str) -> Iterable[Topic]:
+        """List all topics in a project (a live view — iterate it once, don't hold it)."""
+        return self.topics.get(project, {}).values()
 
     def delete_topic(self, project: str, topic_id: str) -> None:
         """Delete a topic."""
@@ -109,12 +109,12 @@ class PubSubStorage:
         """Retrieve a subscription."""
         return self.subscriptions.get(project, {}).get(subscription_id)
 
-    def list_subscriptions(self, project: str, topic_id: Optional[str] = None) -> List[Subscription]:
-        """List subscriptions, optionally filtered by topic."""
-        subs = list(self.subscriptions.get(project, {}).values())
+    def list_subscriptions(self, project: str, topic_id: Optional[str] = None) -> Iterable[Subscription]:
+        """List subscriptions, optionally filtered by topic (a live view when unfiltered)."""
+        subs = self.subscriptions.get(project, {}).values()
         if topic_id:
             topic_name = f"projects/{project}/topics/{topic_id}"
-            subs = [s for s in subs if s.topic == topic_name]
+            return [s for s in subs if s.topic == topic_name]
         return subs
 
     def delete_subscription(self, project: str, subscription_id: str) -> None:
@@ -135,7 +135,7 @@ class PubSubStorage:
         message = {
             "data": data,
             "attributes": attributes or {},
-            "messageId": str(uuid.uuid4()),
+            "messageId": uuid.uuid4().hex,
             "publishTime": datetime.now(timezone.utc).isoformat(),
         }
 
@@ -170,7 +170,7 @@ class PubSubStorage:
             # Get up to max_messages
             for i in range(min(max_messages, len(available))):
                 message = available.pop(0)
-                ack_id = str(uuid.uuid4())
+                ack_id = uuid.uuid4().hex
 
                 # Track for acknowledgment
                 if project not in self.subscription_pending:
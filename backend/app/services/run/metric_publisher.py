@@ -35,7 +35,7 @@ class CloudRunMetricPublisher:
                 await self._publish_metrics()
                 await asyncio.sleep(self.publish_interval)
         except Exception as e:
-            logger.error(f"[CloudRunMetricPublisher] Error in publisher loop: {e}")
+            logger.error("[CloudRunMetricPublisher] Error in publisher loop: %s", e)
 
     async def stop(self):
         """Stop the metric publisher."""
@@ -66,7 +66,7 @@ class CloudRunMetricPublisher:
                     await self._publish_service_metrics(service_data)
 
         except Exception as e:
-            logger.error(f"[CloudRunMetricPublisher] Error publishing metrics: {e}")
+            logger.error("[CloudRunMetricPublisher] Error publishing metrics: %s", e)
 
     async def _publish_service_metrics(self, service_data: Dict[str, Any]):
         """Publish metrics for a single Cloud Run service."""
@@ -248,10 +248,11 @@ class CloudRunMetricPublisher:
                     )
                     self.monitoring_storage.put_metric_descriptor(project, descriptor)
 
-            logger.debug(f"[CloudRunMetricPublisher] Published {len(time_series_list)} metrics for service {service_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[CloudRunMetricPublisher] Published %s metrics for service %s", len(time_series_list), service_id)
 
         except Exception as e:
-            logger.error(f"[CloudRunMetricPublisher] Error publishing service metrics: {e}")
+            logger.error("[CloudRunMetricPublisher] Error publishing service metrics: %s", e)
 
     def get_service_count(self) -> int:
         """Get total count of services being monitored."""
@@ -1,6 +1,5 @@
 """Cloud Run (simulated) API."""
 from typing import Any, Dict, List, Optional
-import random
 import threading
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -17,6 +16,7 @@ from app.core.docker_manager import (
     ensure_local_registry,
     normalize_registry_image,
 )
+from app.utils.ids import next_operation_id
 
 router = APIRouter()
 
@@ -25,8 +25,7 @@ _operations: Dict[str, Dict[str, Any]] = {}
 
 
 def _op_name(project: str, location: str) -> str:
-    suffix = random.randint(1_000_000_000_000, 9_999_999_999_999)
-    return f"projects/{project}/locations/{location}/operations/{suffix}"
+    return f"projects/{project}/locations/{location}/operations/{next_operation_id()}"
 
 
 def _operation(project: str, location: str, metadata: Dict[str, Any], response: Dict[str, Any]) -> Dict[str, Any]:
@@ -57,7 +57,7 @@ async def create_secret(
     except ValueError as e:
         raise HTTPException(409, str(e))
     except Exception as e:
-        logger.error(f"Error creating secret: {e}")
+        logger.error("Error creating secret: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -75,7 +75,7 @@ async def get_secret(project: str, secret: str) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting secret: {e}")
+        logger.error("Error getting secret: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -95,7 +95,7 @@ async def list_secrets(
         }
     
     except Exception as e:
-        logger.error(f"Error listing secrets: {e}")
+        logger.error("Error listing secrets: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -123,7 +123,7 @@ async def update_secret(
     except ValueError as e:
         raise HTTPException(404, str(e))
     except Exception as e:
-        logger.error(f"Error updating secret: {e}")
+        logger.error("Error updating secret: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -141,7 +141,7 @@ async def delete_secret(project: str, secret: str) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting secret: {e}")
+        logger.error("Error deleting secret: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -173,7 +173,7 @@ async def add_secret_version(
     except ValueError as e:
         raise HTTPException(404, str(e))
     except Exception as e:
-        logger.error(f"Error adding version: {e}")
+        logger.error("Error adding version: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -194,7 +194,7 @@ async def list_secret_versions(
         }
     
     except Exception as e:
-        logger.error(f"Error listing versions: {e}")
+        logger.error("Error listing versions: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -216,7 +216,7 @@ async def get_secret_version(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting version: {e}")
+        logger.error("Error getting version: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -243,7 +243,7 @@ async def access_secret_version(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error accessing version: {e}")
+        logger.error("Error accessing version: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -265,7 +265,7 @@ async def disable_secret_version(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error disabling version: {e}")
+        logger.error("Error disabling version: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -289,7 +289,7 @@ async def enable_secret_version(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error enabling version: {e}")
+        logger.error("Error enabling version: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -311,7 +311,7 @@ async def destroy_secret_version(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error destroying version: {e}")
+        logger.error("Error destroying version: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -346,7 +346,7 @@ async def generate_random_password(body: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     except Exception as e:
-        logger.error(f"Error generating password: {e}")
+        logger.error("Error generating password: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
 
 
@@ -366,5 +366,5 @@ async def health_check() -> Dict[str, Any]:
         }
     
     except Exception as e:
-        logger.error(f"Health check error: {e}")
+        logger.error("Health check error: %s", e)
         raise HTTPException(500, f"Error: {str(e)}")
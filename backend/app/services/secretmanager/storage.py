@@ -61,7 +61,7 @@ class SecretManagerStorage:
         
         self.secrets[project_id][secret_id] = secret
         
-        logger.info(f"Created secret {project_id}/{secret_id}")
+        logger.info("Created secret %s/%s", project_id, secret_id)
         return secret
 
     def get_secret(self, project_id: str, secret_id: str) -> Optional[Secret]:
@@ -92,7 +92,7 @@ class SecretManagerStorage:
         
         secret.updated_time = datetime.now(timezone.utc)
         
-        logger.info(f"Updated secret {project_id}/{secret_id}")
+        logger.info("Updated secret %s/%s", project_id, secret_id)
         return secret
 
     def delete_secret(self, project_id: str, secret_id: str) -> bool:
@@ -103,7 +103,7 @@ class SecretManagerStorage:
         
         del self.secrets[project_id][secret_id]
         
-        logger.info(f"Deleted secret {project_id}/{secret_id}")
+        logger.info("Deleted secret %s/%s", project_id, secret_id)
         return True
 
     # ========================================================================
@@ -124,7 +124,7 @@ class SecretManagerStorage:
         
         version = secret.add_version(payload)
         
-        logger.info(f"Added version {version.version_id} to secret {secret_id}")
+        logger.info("Added version %s to secret %s", version.version_id, secret_id)
         return version
 
     def get_secret_version(
@@ -193,7 +193,7 @@ class SecretManagerStorage:
         
         version.state = SecretVersionState.DISABLED
         
-        logger.info(f"Disabled version {version_id} of secret {secret_id}")
+        logger.info("Disabled version %s of secret %s", version_id, secret_id)
         return version
 
     def enable_secret_version(
@@ -218,7 +218,7 @@ class SecretManagerStorage:
         if secret:
             secret.current_version_id = version_id
         
-        logger.info(f"Enabled version {version_id} of secret {secret_id}")
+        logger.info("Enabled version %s of secret %s", version_id, secret_id)
         return version
 
     def destroy_secret_version(
@@ -236,7 +236,7 @@ class SecretManagerStorage:
         version.state = SecretVersionState.DESTROYED
         version.destroy_time = datetime.now(timezone.utc)
         
-        logger.info(f"Destroyed version {version_id} of secret {secret_id}")
+        logger.info("Destroyed version %s of secret %s", version_id, secret_id)
         return version
 
     # ========================================================================
@@ -3,18 +3,24 @@ VPC Network service router.
 Consolidates: Networks, Subnets, Firewall Rules, Routes (existing)
 Sprint 2 additions: Cloud Router, Cloud NAT, VPC Peering, Flow Logs toggle.
 """
-import random
 import ipaddress
-import docker
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.models.database import (
     get_db, Network, Subnet, Instance,
     Firewall, Route, CloudRouter, CloudNAT, VPCPeering,
 )
+from app.core.docker_manager import create_docker_network_with_cidr, remove_docker_network
+from app.utils.ids import next_operation_id
 from app.utils.ip_manager import validate_cidr, get_gateway_ip, get_ip_at_offset
+from app.utils.region_subnets import get_auto_mode_subnets, is_auto_mode_cidr
 
 from .models import (
     CreateNetworkRequest, CreateSubnetRequest, PatchSubnetRequest,
@@ -25,18 +31,13 @@ from .models import (
 
 router = APIRouter()
 
-try:
-    _docker = docker.from_env()
-except Exception:
-    _docker = None
-
 
 # ────────────────────────────────────────────────────────
 # Helpers
 # ────────────────────────────────────────────────────────
 
 def _op(project: str, op_type: str, target: str, scope: str = "global") -> dict:
-    oid = str(random.randint(10 ** 12, 10 ** 13 - 1))
+    oid = next_operation_id()
     # Extract resource name from target link
     resource_name = target.split("/")[-1] if "/" in target else target
     return {
@@ -68,6 +69,45 @@ def _subnet_resource(s: Subnet, project: str) -> dict:
     }
 
 
+# Subnet GETs are polled heavily by infra tooling and subnets rarely change.
+# Serialized responses are kept per project for a short TTL, least recently
+# used project first; every code path that adds, changes or removes a subnet
+# drops the project's entries after its commit. As with the storage bucket
+# cache, an invalidation bumps the epoch and a build() that overlapped one
+# doesn't store its (possibly pre-commit) body.
+SUBNET_CACHE_TTL_SECONDS = 15.0
+SUBNET_CACHE_MAX_PROJECTS = 256
+_subnet_cache: "OrderedDict[str, Dict[Tuple[str, ...], Tuple[float, bytes]]]" = OrderedDict()
+_subnet_cache_lock = threading.Lock()
+_subnet_cache_epoch = 0
+
+
+def _cached_subnet_response(project: str, key: Tuple[str, ...], build: Callable[[], dict]) -> Response:
+    now = time.monotonic()
+    with _subnet_cache_lock:
+        hit = _subnet_cache.get(project, {}).get(key)
+        if hit is not None and now - hit[0] < SUBNET_CACHE_TTL_SECONDS:
+            _subnet_cache.move_to_end(project)
+            return Response(content=hit[1], media_type="application/json")
+        epoch = _subnet_cache_epoch
+    # build() raises HTTPException for a missing subnet, so misses are never cached
+    body = orjson.dumps(build())
+    with _subnet_cache_lock:
+        if epoch == _subnet_cache_epoch:
+            _subnet_cache.setdefault(project, {})[key] = (now, body)
+            _subnet_cache.move_to_end(project)
+            if len(_subnet_cache) > SUBNET_CACHE_MAX_PROJECTS:
+                _subnet_cache.popitem(last=False)
+    return Response(content=body, media_type="application/json")
+
+
+def invalidate_subnet_cache(project: str) -> None:
+    global _subnet_cache_epoch
+    with _subnet_cache_lock:
+        _subnet_cache.pop(project, None)
+        _subnet_cache_epoch += 1
+
+
 def _fw_resource(fw: Firewall, project: str) -> dict:
     return {
         "kind": "compute#firewall",
@@ -110,6 +150,9 @@ def _route_resource(r: Route, project: str) -> dict:
 # Default network bootstrap helpers
 # ────────────────────────────────────────────────────────
 
+# The route helpers only add rows; the caller commits them together with the
+# network/subnet they belong to.
+
 def _create_igw_route(db, project, network_name):
     name = f"default-route-{network_name}"
     if db.query(Route).filter_by(project_id=project, name=name).first():
@@ -122,7 +165,6 @@ def _create_igw_route(db, project, network_name):
         priority=1000,
     )
     db.add(route)
-    db.commit()
 
 
 def _create_subnet_route(db, project, network_name, subnet_name, subnet_cidr):
@@ -137,7 +179,6 @@ def _create_subnet_route(db, project, network_name, subnet_name, subnet_cidr):
         priority=1000,
     )
     db.add(route)
-    db.commit()
 
 
 def _init_default_firewall_rules(db: Session, project: str, network_name: str = "default"):
@@ -190,28 +231,31 @@ def _init_default_firewall_rules(db: Session, project: str, network_name: str =
         }
     ]
     
-    for rule_data in default_rules:
-        # Check if rule already exists
-        existing = db.query(Firewall).filter_by(
-            project_id=project,
-            name=rule_data["name"]
-        ).first()
-        
-        if not existing:
-            rule = Firewall(
-                name=rule_data["name"],
-                network=network_name,
+    # The existence checks mustn't flush the rules added on earlier passes —
+    # the names differ, so all five INSERTs can wait for the single commit
+    with db.no_autoflush:
+        for rule_data in default_rules:
+            # Check if rule already exists
+            existing = db.query(Firewall).filter_by(
                 project_id=project,
-                description=rule_data["description"],
-                direction=rule_data["direction"],
-                priority=rule_data["priority"],
-                source_ranges=rule_data.get("sourceRanges"),
-                destination_ranges=rule_data.get("destinationRanges"),
-                allowed=rule_data.get("allowed"),
-                denied=rule_data.get("denied"),
-                disabled=False
-            )
-            db.add(rule)
+                name=rule_data["name"]
+            ).first()
+            
+            if not existing:
+                rule = Firewall(
+                    name=rule_data["name"],
+                    network=network_name,
+                    project_id=project,
+                    description=rule_data["description"],
+                    direction=rule_data["direction"],
+                    priority=rule_data["priority"],
+                    source_ranges=rule_data.get("sourceRanges"),
+                    destination_ranges=rule_data.get("destinationRanges"),
+                    allowed=rule_data.get("allowed"),
+                    denied=rule_data.get("denied"),
+                    disabled=False
+                )
+                db.add(rule)
     
     db.commit()
     print(f"✅ Phase 1: Initialized 5 default firewall rules for project {project}")
@@ -219,8 +263,6 @@ def _init_default_firewall_rules(db: Session, project: str, network_name: str =
 
 def ensure_default_network(db: Session, project: str):
     """Bootstrap default VPC + subnet if missing."""
-    from app.core.docker_manager import create_docker_network_with_cidr
-    
     default = db.query(Network).filter_by(project_id=project, name="default").first()
     if not default:
         cidr_range = "10.128.0.0/16"
@@ -241,8 +283,6 @@ def ensure_default_network(db: Session, project: str):
             cidr_range=cidr_range,
         )
         db.add(default)
-        db.commit()
-        db.refresh(default)
         _create_igw_route(db, project, "default")
 
     # Ensure at least one subnet
@@ -255,11 +295,12 @@ def ensure_default_network(db: Session, project: str):
             gateway_ip=get_gateway_ip(subnet_cidr), next_available_ip=2,
         )
         db.add(sn)
-        db.commit()
         _create_subnet_route(db, project, "default", "default-subnet-us-central1", subnet_cidr)
     
-    # Phase 1: Initialize default firewall rules
+    # Phase 1: Initialize default firewall rules — its commit also persists
+    # the network, subnet and routes added above
     _init_default_firewall_rules(db, project, "default")
+    invalidate_subnet_cache(project)
     
     return default
 
@@ -303,9 +344,6 @@ def get_network(project: str, network_name: str, db: Session = Depends(get_db)):
 
 @router.post("/projects/{project}/global/networks")
 def create_network(project: str, body: CreateNetworkRequest, db: Session = Depends(get_db)):
-    from app.core.docker_manager import create_docker_network_with_cidr
-    from app.utils.region_subnets import get_auto_mode_subnets, is_auto_mode_cidr
-
     # Choose a non-overlapping CIDR; fall back to 10.200.0.0/16 to avoid colliding with default 10.128.0.0/16
     cidr_input = body.IPv4Range or "10.200.0.0/16"
     if cidr_input == "10.128.0.0/16":
@@ -329,8 +367,6 @@ def create_network(project: str, body: CreateNetworkRequest, db: Session = Depen
         cidr_range=cidr, auto_create_subnetworks=body.autoCreateSubnetworks,
     )
     db.add(net)
-    db.commit()
-    db.refresh(net)
     _create_igw_route(db, project, body.name)
 
     if body.autoCreateSubnetworks and is_auto_mode_cidr(cidr):
@@ -342,7 +378,11 @@ def create_network(project: str, body: CreateNetworkRequest, db: Session = Depen
             )
             db.add(sn)
             _create_subnet_route(db, project, body.name, sn.name, ri["cidr"])
-        db.commit()
+
+    # One transaction for the network, its subnets and all their routes
+    db.commit()
+    if body.autoCreateSubnetworks:
+        invalidate_subnet_cache(project)
 
     return _op(project, "insert",
                f"https://www.googleapis.com/compute/v1/projects/{project}/global/networks/{body.name}")
@@ -359,16 +399,14 @@ def delete_network(project: str, network_name: str, db: Session = Depends(get_db
                                   Instance.network_url.like(f"%{network_name}%")).first():
         raise HTTPException(400, f"Network {network_name} is in use by instances")
 
-    if n.docker_network_name and n.docker_network_name != "bridge" and _docker:
-        try:
-            _docker.networks.get(n.docker_network_name).remove()
-        except Exception:
-            pass
+    if n.docker_network_name and n.docker_network_name != "bridge":
+        remove_docker_network(n.docker_network_name)
 
-    db.query(Route).filter_by(project_id=project, network=network_name).delete()
-    db.query(Subnet).filter_by(project_id=project, network=network_name).delete()
+    db.query(Route).filter_by(project_id=project, network=network_name).delete(synchronize_session=False)
+    db.query(Subnet).filter_by(project_id=project, network=network_name).delete(synchronize_session=False)
     db.delete(n)
     db.commit()
+    invalidate_subnet_cache(project)
     return _op(project, "delete",
                f"https://www.googleapis.com/compute/v1/projects/{project}/global/networks/{network_name}")
 
@@ -379,28 +417,34 @@ def delete_network(project: str, network_name: str, db: Session = Depends(get_db
 
 @router.get("/projects/{project}/aggregated/subnetworks")
 def list_subnets_aggregated(project: str, db: Session = Depends(get_db)):
-    subnets = db.query(Subnet).filter_by(project_id=project).all()
-    items: dict = {}
-    for s in subnets:
-        key = f"regions/{s.region}"
-        items.setdefault(key, {"subnetworks": []})
-        items[key]["subnetworks"].append(_subnet_resource(s, project))
-    return {"kind": "compute#subnetworkAggregatedList", "items": items}
+    def build() -> dict:
+        subnets = db.query(Subnet).filter_by(project_id=project).all()
+        items: dict = {}
+        for s in subnets:
+            key = f"regions/{s.region}"
+            items.setdefault(key, {"subnetworks": []})
+            items[key]["subnetworks"].append(_subnet_resource(s, project))
+        return {"kind": "compute#subnetworkAggregatedList", "items": items}
+    return _cached_subnet_response(project, ("aggregated",), build)
 
 
 @router.get("/projects/{project}/regions/{region}/subnetworks")
 def list_subnets(project: str, region: str, db: Session = Depends(get_db)):
-    subnets = db.query(Subnet).filter_by(project_id=project, region=region).all()
-    return {"kind": "compute#subnetworkList",
-            "items": [_subnet_resource(s, project) for s in subnets]}
+    def build() -> dict:
+        subnets = db.query(Subnet).filter_by(project_id=project, region=region).all()
+        return {"kind": "compute#subnetworkList",
+                "items": [_subnet_resource(s, project) for s in subnets]}
+    return _cached_subnet_response(project, ("list", region), build)
 
 
 @router.get("/projects/{project}/regions/{region}/subnetworks/{subnet_name}")
 def get_subnet(project: str, region: str, subnet_name: str, db: Session = Depends(get_db)):
-    s = db.query(Subnet).filter_by(project_id=project, name=subnet_name, region=region).first()
-    if not s:
-        raise HTTPException(404, f"Subnet {subnet_name} not found")
-    return _subnet_resource(s, project)
+    def build() -> dict:
+        s = db.query(Subnet).filter_by(project_id=project, name=subnet_name, region=region).first()
+        if not s:
+            raise HTTPException(404, f"Subnet {subnet_name} not found")
+        return _subnet_resource(s, project)
+    return _cached_subnet_response(project, ("get", region, subnet_name), build)
 
 
 @router.post("/projects/{project}/regions/{region}/subnetworks")
@@ -436,8 +480,9 @@ def create_subnet(project: str, region: str, body: CreateSubnetRequest, db: Sess
         gateway_ip=get_gateway_ip(body.ipCidrRange), next_available_ip=2,
     )
     db.add(sn)
-    db.commit()
     _create_subnet_route(db, project, network_name, body.name, body.ipCidrRange)
+    db.commit()
+    invalidate_subnet_cache(project)
     return _op(project, "insert",
                f"https://www.googleapis.com/compute/v1/projects/{project}/regions/{region}/subnetworks/{body.name}",
                scope=f"regions/{region}")
@@ -470,6 +515,7 @@ def patch_subnet(project: str, region: str, subnet_name: str,
         s.ip_cidr_range = body.ipCidrRange
 
     db.commit()
+    invalidate_subnet_cache(project)
     return _subnet_resource(s, project)
 
 
@@ -482,6 +528,7 @@ def delete_subnet(project: str, region: str, subnet_name: str, db: Session = Dep
         raise HTTPException(400, f"Subnet {subnet_name} is in use by instances")
     db.delete(s)
     db.commit()
+    invalidate_subnet_cache(project)
     return _op(project, "delete",
                f"https://www.googleapis.com/compute/v1/projects/{project}/regions/{region}/subnetworks/{subnet_name}",
                scope=f"regions/{region}")
@@ -688,7 +735,7 @@ def delete_router(project: str, region: str, router_name: str, db: Session = Dep
     if not r:
         raise HTTPException(404, f"Router {router_name} not found")
     # Delete associated NATs first
-    db.query(CloudNAT).filter_by(project_id=project, region=region, router_name=router_name).delete()
+    db.query(CloudNAT).filter_by(project_id=project, region=region, router_name=router_name).delete(synchronize_session=False)
     db.delete(r)
     db.commit()
     return _op(project, "delete",
@@ -0,0 +1,21 @@
+"""Operation ID generation"""
+import itertools
+import os
+import time
+
+# Numeric operation IDs, unique without a DB check or a collision-prone
+# random draw. The high bits count up from the start time in milliseconds,
+# so IDs increase monotonically and don't repeat across an ordinary restart.
+# The low bits are the PID, so workers started in the same millisecond (or
+# forked from one preloaded app) never hand out the same ID. 22 bits covers
+# Linux's largest pid_max, and the result stays within the 19-digit uint64
+# GCP uses for operation IDs.
+_PID_BITS = 22
+_PID_MASK = (1 << _PID_BITS) - 1
+_operation_ids = itertools.count(int(time.time() * 1000))
+
+
+def next_operation_id() -> str:
+    """Next numeric operation ID, as a string"""
+    # PID read per call, not at import: a fork after import must not inherit it
+    return str(next(_operation_ids) << _PID_BITS | os.getpid() & _PID_MASK)
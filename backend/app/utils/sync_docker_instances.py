@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """Sync existing Docker containers (gcp-vm-*) to database as instances"""
-import docker
+from app.core.docker_manager import client, _docker_available
 from app.models.database import SessionLocal, Instance, Project, Network
 import re
 from datetime import datetime
 
 def sync_docker_instances():
     """Find all gcp-vm-* containers and register them as instances"""
-    client = docker.from_env()
+    # Reuse the process-wide client (and its connection pool) rather than
+    # opening another one from the environment
+    if not _docker_available:
+        print("⚠️  Docker unavailable, nothing to sync")
+        return
     db = SessionLocal()
     
     try:
@@ -77,6 +77,32 @@ class TestInstances:
         instances = data.get("items", [])
         assert isinstance(instances, list)
     
+    def test_list_instances_paginated(self, api_client, test_project, test_zone):
+        """maxResults/pageToken walk every instance exactly once"""
+        path = f"/compute/v1/projects/{test_project}/zones/{test_zone}/instances"
+        for n in range(3):
+            name = f"page-test-vm-{n}"
+            resp = api_client.post(path, {"name": name, "machineType": f"zones/{test_zone}/machineTypes/e2-micro"})
+            assert resp.status_code in [200, 201, 409]
+        
+        seen = []
+        token = None
+        while True:
+            query = f"?maxResults=2&pageToken={token}" if token else "?maxResults=2"
+            resp = api_client.get(path + query)
+            assert resp.status_code == 200
+            data = resp.json()
+            assert len(data.get("items", [])) <= 2
+            seen.extend(i["name"] for i in data.get("items", []))
+            token = data.get("nextPageToken")
+            if not token:
+                break
+        
+        assert len(seen) == len(set(seen))
+        for n in range(3):
+            assert f"page-test-vm-{n}" in seen
+            api_client.delete(f"{path}/page-test-vm-{n}")
+    
     def test_create_instance(self, api_client, test_project, test_zone, sample_instance_payload, cleanup_resources):
         """Create a new VM instance"""
         path = f"/compute/v1/projects/{test_project}/zones/{test_zone}/instances"
@@ -181,6 +207,34 @@ class TestInstances:
         
         assert delete_resp.status_code in [200, 204]
 
+    
+    def test_create_instance_with_nat_ip(self, api_client, test_project, test_zone, test_region):
+        """A natIP must be a reserved address; the instance holds it until deleted"""
+        path = f"/compute/v1/projects/{test_project}/zones/{test_zone}/instances"
+        address_path = f"/compute/v1/projects/{test_project}/regions/{test_region}/addresses"
+        resp = api_client.post(address_path, {"name": "nat-ip-test", "address": "192.0.2.200"})
+        assert resp.status_code in [200, 201]
+        
+        def payload(name, nat_ip):
+            return {"name": name, "networkInterfaces": [
+                {"network": "global/networks/default", "accessConfigs": [{"natIP": nat_ip}]},
+            ]}
+        
+        try:
+            assert api_client.post(path, payload("nat-ip-test-vm", "192.0.2.200")).status_code == 200
+            address = api_client.get(f"{address_path}/nat-ip-test").json()
+            assert address["status"] == "IN_USE"
+            
+            # Taken, and never reserved
+            assert api_client.post(path, payload("nat-ip-test-vm-2", "192.0.2.200")).status_code == 400
+            assert api_client.post(path, payload("nat-ip-test-vm-2", "198.51.100.7")).status_code == 400
+            
+            assert api_client.delete(f"{path}/nat-ip-test-vm").status_code == 200
+            address = api_client.get(f"{address_path}/nat-ip-test").json()
+            assert address["status"] == "RESERVED"
+        finally:
+            api_client.delete(f"{path}/nat-ip-test-vm")
+            api_client.delete(f"{address_path}/nat-ip-test")
 
 class TestAddresses:
     """Test Static External IP Addresses"""
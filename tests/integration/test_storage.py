@@ -5,6 +5,7 @@ Tests for Cloud Storage endpoints: buckets, objects, versioning, signed URLs
 
 import pytest
 import json
+import time
 from typing import Dict, Any
 
 pytestmark = pytest.mark.integration
@@ -79,6 +80,22 @@ class TestBuckets:
         delete_resp = api_client.delete(delete_path)
         
         assert delete_resp.status_code in [200, 204]
+    
+    def test_create_existing_bucket(self, api_client, test_project, sample_bucket_payload, cleanup_resources):
+        """A taken name is a 409, or the existing bucket under ifNotExists; deleting frees it"""
+        path = f"/storage/v1/b?project={test_project}"
+        bucket_name = sample_bucket_payload["name"] = "existing-name-test-bucket"
+        
+        assert api_client.post(path, sample_bucket_payload).status_code in [200, 201]
+        assert api_client.post(path, sample_bucket_payload).status_code == 409
+        
+        resp = api_client.post(f"{path}&ifNotExists=true", sample_bucket_payload)
+        assert resp.status_code == 200
+        assert resp.json()["name"] == bucket_name
+        
+        assert api_client.delete(f"/storage/v1/b/{bucket_name}").status_code in [200, 204]
+        assert api_client.post(path, sample_bucket_payload).status_code in [200, 201]
+        cleanup_resources["buckets"].append(bucket_name)
 
 
 class TestObjects:
@@ -233,3 +250,97 @@ class TestSignedURLs:
         if resp.status_code == 200:
             data = resp.json()
             assert "signedUrl" in data or "url" in data
+
+
+class TestObjectAcls:
+    """Test Object ACLs"""
+    
+    def test_batch_update_object_acls(self, api_client, test_project):
+        """Set ACLs on several objects in one request"""
+        bucket_name = "acl-batch-test-bucket"
+        create_resp = api_client.post(f"/storage/v1/b?project={test_project}", {"name": bucket_name})
+        if create_resp.status_code not in [200, 201, 409]:
+            pytest.skip("Cannot create bucket")
+        
+        try:
+            # Versioned, with a.txt uploaded twice: the batch must only touch
+            # the latest generation
+            resp = api_client.patch(f"/storage/v1/b/{bucket_name}", {"versioning": {"enabled": True}})
+            assert resp.status_code == 200
+            generations = {}
+            for name in ("a.txt", "b.txt", "a.txt"):
+                upload = api_client.post(f"/storage/v1/b/{bucket_name}/o?uploadType=media&name={name}", b"acl")
+                assert upload.status_code in [200, 201]
+                generations.setdefault(name, upload.json()["generation"])
+            
+            path = f"/storage/v1/b/{bucket_name}/objectAcls:batchUpdate"
+            resp = api_client.post(path, {"items": [
+                {"object": "a.txt", "acl": "public-read"},
+                {"object": "b.txt", "acl": "authenticated-read"},
+            ]})
+            
+            assert resp.status_code == 200
+            items = resp.json()["items"]
+            assert {i["object"]: i["acl"] for i in items} == {
+                "a.txt": "public-read",
+                "b.txt": "authenticated-read",
+            }
+            acl_path = f"/storage/v1/b/{bucket_name}/o/a.txt/acl"
+            assert api_client.get(acl_path).json()["acl"] == "public-read"
+            old = api_client.get(f"{acl_path}?generation={generations['a.txt']}")
+            assert old.status_code == 200
+            assert old.json()["acl"] == "private"
+            
+            # Invalid entries reject the whole batch
+            bad = api_client.post(path, {"items": [
+                {"object": "a.txt", "acl": "private"},
+                {"object": "b.txt", "acl": "everyone"},
+            ]})
+            assert bad.status_code == 400
+            
+            missing = api_client.post(path, {"items": [{"object": "nope.txt", "acl": "private"}]})
+            assert missing.status_code == 404
+        finally:
+            api_client.delete(f"/storage/v1/b/{bucket_name}?force=true")
+
+    def test_default_acl_survives_write_behind_flush(self, api_client, test_project):
+        """A bucket GET inside the ACL flush window must not re-cache the old ACL"""
+        bucket_name = "acl-flush-test-bucket"
+        create_resp = api_client.post(f"/storage/v1/b?project={test_project}", {"name": bucket_name})
+        if create_resp.status_code not in [200, 201, 409]:
+            pytest.skip("Cannot create bucket")
+        
+        try:
+            path = f"/storage/v1/b/{bucket_name}/defaultObjectAcl"
+            assert api_client.patch(path, {"acl": "private"}).status_code == 200
+            time.sleep(0.2)
+            
+            resp = api_client.patch(path, {"acl": "public-read"})
+            assert resp.status_code == 200
+            # Lands before the write-behind flush commits
+            assert api_client.get(f"/storage/v1/b/{bucket_name}").status_code == 200
+            time.sleep(0.2)
+            
+            resp = api_client.get(path)
+            assert resp.status_code == 200
+            assert resp.json()["acl"] == "public-read"
+        finally:
+            api_client.delete(f"/storage/v1/b/{bucket_name}?force=true")
+    
+    def test_recreated_bucket_starts_with_default_acl(self, api_client, test_project):
+        """Deleting a bucket drops its ACL, including a write still queued"""
+        bucket_name = "acl-recreate-test-bucket"
+        create_path = f"/storage/v1/b?project={test_project}"
+        path = f"/storage/v1/b/{bucket_name}/defaultObjectAcl"
+        assert api_client.post(create_path, {"name": bucket_name}).status_code in [200, 201]
+        
+        try:
+            assert api_client.patch(path, {"acl": "public-read"}).status_code == 200
+            assert api_client.delete(f"/storage/v1/b/{bucket_name}").status_code in [200, 204]
+            assert api_client.get(path).status_code == 404
+            
+            assert api_client.post(create_path, {"name": bucket_name}).status_code in [200, 201]
+            time.sleep(0.2)
+            assert api_client.get(path).json()["acl"] == "private"
+        finally:
+            api_client.delete(f"/storage/v1/b/{bucket_name}?force=true")
@@ -0,0 +1,91 @@
+"""
+CloudTester - Cloud Storage Bulk Loading Tests
+Tests for create_buckets against a throwaway SQLite database
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+
+from app.api import storage  # noqa: E402
+from app.models.database import Base, Bucket  # noqa: E402
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Session on an empty SQLite database, with bucket directories under tmp_path"""
+    monkeypatch.setattr(storage, "STORAGE_DIR", str(tmp_path / "storage"))
+    engine = create_engine(f"sqlite:///{tmp_path / 'buckets.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestCreateBuckets:
+    """Test create_buckets (executemany INSERT path)"""
+
+    def test_creates_rows_and_directories(self, db, tmp_path):
+        specs = [storage.BucketCreate(name=f"bulk-bucket-{n}") for n in range(3)]
+
+        created = storage.create_buckets(db, "test-project", specs)
+
+        assert created == ["bulk-bucket-0", "bulk-bucket-1", "bulk-bucket-2"]
+        rows = db.query(Bucket.name, Bucket.project_id, Bucket.location).order_by(Bucket.name).all()
+        assert [tuple(r) for r in rows] == [(name, "test-project", "US") for name in created]
+        for name in created:
+            assert (tmp_path / "storage" / name).is_dir()
+
+    def test_skips_repeated_and_taken_names(self, db, tmp_path):
+        storage.create_buckets(db, "test-project", [storage.BucketCreate(name="taken-bucket")])
+
+        created = storage.create_buckets(db, "test-project", [
+            storage.BucketCreate(name="fresh-bucket"),
+            storage.BucketCreate(name="taken-bucket"),
+            storage.BucketCreate(name="fresh-bucket", location="EU"),
+        ])
+
+        assert created == ["fresh-bucket"]
+        assert db.query(Bucket).count() == 2
+        # The first spec for a repeated name wins
+        assert db.query(Bucket.location).filter_by(name="fresh-bucket").scalar() == "US"
+        assert (tmp_path / "storage" / "fresh-bucket").is_dir()
+
+    def test_nothing_to_create(self, db):
+        storage.create_buckets(db, "test-project", [storage.BucketCreate(name="only-bucket")])
+
+        assert storage.create_buckets(db, "test-project", []) == []
+        assert storage.create_buckets(db, "test-project", [storage.BucketCreate(name="only-bucket")]) == []
+
+    def test_invalid_name_rejects_batch(self, db):
+        with pytest.raises(ValueError, match="Bad_Bucket"):
+            storage.create_buckets(db, "test-project", [
+                storage.BucketCreate(name="good-bucket"),
+                storage.BucketCreate(name="Bad_Bucket"),
+            ])
+
+        assert db.query(Bucket).count() == 0
+
+    def test_name_taken_by_another_session(self, db, tmp_path):
+        """A row committed elsewhere is skipped by the INSERT itself, not a pre-check"""
+        other = sessionmaker(bind=db.get_bind())()
+        other.add(Bucket(id="raced-bucket", name="raced-bucket", project_id="other-project"))
+        other.commit()
+        other.close()
+
+        created = storage.create_buckets(db, "test-project", [
+            storage.BucketCreate(name="raced-bucket"),
+            storage.BucketCreate(name="calm-bucket"),
+        ])
+
+        assert created == ["calm-bucket"]
+        assert db.query(Bucket.project_id).filter_by(name="raced-bucket").scalar() == "other-project"
+        assert not (tmp_path / "storage" / "raced-bucket").exists()